@@ -0,0 +1,39 @@
+"""Store parenthetical score as real; index (group_id, score DESC)
+
+Revision ID: 07a3d843cacb
+Revises: 39f42dfbf498
+Create Date: 2025-11-21 16:58:07.634152
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '07a3d843cacb'
+down_revision = '39f42dfbf498'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Scores are coarse relevance weights; single precision halves the column.
+    # This rewrites the table once (and rebuilds its indexes).
+    op.execute("ALTER TABLE search_parenthetical ALTER COLUMN score TYPE real")
+
+    # "Best parentheticals in a group" reads the top N straight off this
+    # index, which also covers plain group_id lookups
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_parenthetical_group_score
+        ON search_parenthetical (group_id, score DESC NULLS LAST)
+    """)
+    op.execute("DROP INDEX IF EXISTS ix_search_parenthetical_group_id")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_search_parenthetical_group_id
+        ON search_parenthetical (group_id)
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_parenthetical_group_score")
+    op.execute("ALTER TABLE search_parenthetical ALTER COLUMN score TYPE double precision")
@@ -0,0 +1,54 @@
+"""Add generated tsvector column for opinion cluster search
+
+Revision ID: 09d047634f43
+Revises: 972d2425885f
+Create Date: 2025-11-17 15:48:12.630914
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '09d047634f43'
+down_revision = '972d2425885f'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_COLUMNS = ("case_name", "case_name_short", "case_name_full", "judges")
+
+
+def upgrade() -> None:
+    # Must match OpinionCluster.search_vector
+    op.execute("""
+        ALTER TABLE search_opinioncluster
+        ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english',
+                coalesce(case_name, '') || ' ' ||
+                coalesce(case_name_short, '') || ' ' ||
+                coalesce(case_name_full, '') || ' ' ||
+                coalesce(judges, ''))
+        ) STORED
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_opinion_search_vector
+        ON search_opinioncluster USING GIN (search_vector)
+    """)
+
+    # GET /api/opinions/ no longer uses ILIKE, so the trigram indexes from
+    # 972d2425885f would only slow down imports
+    for column in TRIGRAM_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS idx_opinion_{column}_trgm")
+
+
+def downgrade() -> None:
+    for column in TRIGRAM_COLUMNS:
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_opinion_{column}_trgm
+            ON search_opinioncluster USING GIN ({column} gin_trgm_ops)
+        """)
+
+    op.execute("DROP INDEX IF EXISTS idx_opinion_search_vector")
+    op.execute("ALTER TABLE search_opinioncluster DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,44 @@
+"""Add generated name_full column to people_db_person
+
+Revision ID: 134b62637bc2
+Revises: f850bc04f947
+Create Date: 2025-11-20 14:37:09.281640
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '134b62637bc2'
+down_revision = 'f850bc04f947'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Must match Person.name_full. concat_ws is only STABLE, so the
+    # generation expression is built from || and ltrim, which are IMMUTABLE.
+    op.execute("""
+        ALTER TABLE people_db_person
+        ADD COLUMN IF NOT EXISTS name_full text
+        GENERATED ALWAYS AS (
+            ltrim(
+                coalesce(name_first, '') ||
+                coalesce(' ' || name_middle, '') ||
+                coalesce(' ' || name_last, '') ||
+                coalesce(' ' || name_suffix, ''))
+        ) STORED
+    """)
+
+    # Trigram GIN index serves unanchored ILIKE name search
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_person_name_full_trgm
+        ON people_db_person USING GIN (name_full gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_person_name_full_trgm")
+    op.execute("ALTER TABLE people_db_person DROP COLUMN IF EXISTS name_full")
@@ -0,0 +1,35 @@
+"""Replace parenthetical described_opinion_id index with (described_opinion_id, score DESC)
+
+Revision ID: 255fc5b3a5f3
+Revises: 134b62637bc2
+Create Date: 2025-11-20 16:02:51.774318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '255fc5b3a5f3'
+down_revision = '134b62637bc2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # "Parentheticals describing opinion X, best first" reads the top N rows
+    # straight off this index. It also covers plain described_opinion_id
+    # lookups, so the single-column index is redundant.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_parenthetical_described_score
+        ON search_parenthetical (described_opinion_id, score DESC NULLS LAST)
+    """)
+    op.execute("DROP INDEX IF EXISTS ix_search_parenthetical_described_opinion_id")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_search_parenthetical_described_opinion_id
+        ON search_parenthetical (described_opinion_id)
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_parenthetical_described_score")
@@ -0,0 +1,29 @@
+"""Add court id covering index for name lookups
+
+Revision ID: 316b3772dc91
+Revises: d68d21f307a7
+Create Date: 2025-11-14 10:41:07.902315
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '316b3772dc91'
+down_revision = 'd68d21f307a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lets the court name lookup in /api/dockets/stats/by-court use an
+    # index-only scan instead of visiting the heap for every court.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_court_id_names
+        ON people_db_court (id) INCLUDE (full_name, short_name)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_court_id_names")
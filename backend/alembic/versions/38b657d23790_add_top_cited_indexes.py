@@ -0,0 +1,39 @@
+"""Add partial citation_count index for top-cited opinions
+
+Revision ID: 38b657d23790
+Revises: e90bbabf89d6
+Create Date: 2025-11-18 16:22:08.913570
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '38b657d23790'
+down_revision = 'e90bbabf89d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves GET /api/opinions/stats/top-cited: an index range scan that stops
+    # after `limit` rows instead of sorting every cited opinion. docket_id is
+    # included for the join to search_docket.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_opinion_top_cited
+        ON search_opinioncluster (citation_count DESC)
+        INCLUDE (docket_id)
+        WHERE citation_count > 0
+    """)
+
+    # Court filter branch of the same endpoint: docket ids for one court
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_docket_court_id_id
+        ON search_docket (court_id, id)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_docket_court_id_id")
+    op.execute("DROP INDEX IF EXISTS idx_opinion_top_cited")
@@ -0,0 +1,44 @@
+"""Drop single-column blocked indexes
+
+Revision ID: 39f42dfbf498
+Revises: a99966503c69
+Create Date: 2025-11-21 15:16:52.348071
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '39f42dfbf498'
+down_revision = 'a99966503c69'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A two-value column: the planner never picks these for blocked = false,
+    # yet every import pays to maintain them.
+    # Dockets: idx_docket_blocked_date (f850bc04f947) already leads with blocked.
+    op.execute("DROP INDEX IF EXISTS ix_search_docket_blocked")
+
+    # Opinion clusters: only the small blocked = true minority is worth an
+    # index, and it is listed in the default date_filed DESC, id DESC order
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_opinion_blocked_date
+        ON search_opinioncluster (date_filed DESC, id DESC)
+        WHERE blocked
+    """)
+    op.execute("DROP INDEX IF EXISTS ix_search_opinioncluster_blocked")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_search_opinioncluster_blocked
+        ON search_opinioncluster (blocked)
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_opinion_blocked_date")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_search_docket_blocked
+        ON search_docket (blocked)
+    """)
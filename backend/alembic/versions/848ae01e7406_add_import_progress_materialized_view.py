@@ -0,0 +1,45 @@
+"""Add mv_import_progress materialized view
+
+Revision ID: 848ae01e7406
+Revises: 316b3772dc91
+Create Date: 2025-11-15 09:27:44.160385
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '848ae01e7406'
+down_revision = '316b3772dc91'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Row counts for the monitored tables, refreshed in the background by
+    # app.services.import_progress instead of counting on every request.
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_import_progress AS
+        SELECT 'search_docket'::text AS table_name, COUNT(*) AS current_count, now() AS updated_at FROM search_docket
+        UNION ALL
+        SELECT 'search_opinioncluster', COUNT(*), now() FROM search_opinioncluster
+        UNION ALL
+        SELECT 'search_opinionscited', COUNT(*), now() FROM search_opinionscited
+        UNION ALL
+        SELECT 'search_parenthetical', COUNT(*), now() FROM search_parenthetical
+        UNION ALL
+        SELECT 'people_db_court', COUNT(*), now() FROM people_db_court
+        UNION ALL
+        SELECT 'people_db_person', COUNT(*), now() FROM people_db_person
+    """)
+
+    # REFRESH ... CONCURRENTLY requires a unique index
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_import_progress_table_name
+        ON mv_import_progress (table_name)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_import_progress")
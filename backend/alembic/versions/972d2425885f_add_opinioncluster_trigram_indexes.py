@@ -0,0 +1,36 @@
+"""Add trigram indexes for opinion cluster substring search
+
+Revision ID: 972d2425885f
+Revises: c70fbed580da
+Create Date: 2025-11-17 09:26:44.105387
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '972d2425885f'
+down_revision = 'c70fbed580da'
+branch_labels = None
+depends_on = None
+
+# Columns matched with ILIKE '%q%' by GET /api/opinions/
+TRIGRAM_COLUMNS = ("case_name", "case_name_short", "case_name_full", "judges")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Trigram GIN indexes serve unanchored ILIKE patterns, so the search
+    # filter no longer needs a sequential scan of the table.
+    for column in TRIGRAM_COLUMNS:
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_opinion_{column}_trgm
+            ON search_opinioncluster USING GIN ({column} gin_trgm_ops)
+        """)
+
+
+def downgrade() -> None:
+    for column in TRIGRAM_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS idx_opinion_{column}_trgm")
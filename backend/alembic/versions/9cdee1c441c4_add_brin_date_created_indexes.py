@@ -0,0 +1,44 @@
+"""Add BRIN indexes on date_created; drop redundant opinion date_filed btree
+
+Revision ID: 9cdee1c441c4
+Revises: 255fc5b3a5f3
+Create Date: 2025-11-20 16:48:30.512907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9cdee1c441c4'
+down_revision = '255fc5b3a5f3'
+branch_labels = None
+depends_on = None
+
+BRIN_TABLES = ("search_docket", "search_opinioncluster")
+
+
+def upgrade() -> None:
+    # Rows are loaded in id order, which tracks date_created closely, so a
+    # BRIN index serves date_created ranges at a tiny fraction of a btree's
+    # size. date_filed is not correlated with physical order and keeps its
+    # btree indexes.
+    for table in BRIN_TABLES:
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS brin_{table}_date_created
+            ON {table} USING BRIN (date_created) WITH (pages_per_range = 32)
+        """)
+
+    # idx_opinion_date_filed_id (a7aa73d3ef6f) leads with date_filed and
+    # serves every lookup this index did
+    op.execute("DROP INDEX IF EXISTS ix_search_opinioncluster_date_filed")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_search_opinioncluster_date_filed
+        ON search_opinioncluster (date_filed)
+    """)
+
+    for table in BRIN_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS brin_{table}_date_created")
@@ -0,0 +1,40 @@
+"""Add server defaults for blocked, citation_count and depth
+
+Revision ID: a0f90267ca4d
+Revises: b700102d1a87
+Create Date: 2025-11-21 11:05:43.920117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a0f90267ca4d'
+down_revision = 'b700102d1a87'
+branch_labels = None
+depends_on = None
+
+# Table -> column -> default expression
+SERVER_DEFAULTS = {
+    "search_docket": {"blocked": "false"},
+    "search_opinioncluster": {"blocked": "false", "citation_count": "0"},
+    "search_opinionscited": {"depth": "1"},
+}
+
+
+def upgrade() -> None:
+    # Catalog-only change: existing rows are untouched, new rows that omit the
+    # column get the default from the database instead of a bound parameter
+    for table, columns in SERVER_DEFAULTS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {column} SET DEFAULT {default}"
+            for column, default in columns.items()
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+
+def downgrade() -> None:
+    for table, columns in SERVER_DEFAULTS.items():
+        alters = ", ".join(f"ALTER COLUMN {column} DROP DEFAULT" for column in columns)
+        op.execute(f"ALTER TABLE {table} {alters}")
@@ -0,0 +1,29 @@
+"""Add opinion cluster (date_filed DESC, id DESC) index
+
+Revision ID: a7aa73d3ef6f
+Revises: 38b657d23790
+Create Date: 2025-11-19 09:41:56.284017
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7aa73d3ef6f'
+down_revision = '38b657d23790'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches the default ORDER BY date_filed DESC, id DESC of GET /api/opinions/,
+    # so a page is read straight off the index (also serves date range filters)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_opinion_date_filed_id
+        ON search_opinioncluster (date_filed DESC, id DESC)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_opinion_date_filed_id")
@@ -0,0 +1,51 @@
+"""Add ON DELETE CASCADE to docket and person child foreign keys
+
+Revision ID: a99966503c69
+Revises: a0f90267ca4d
+Create Date: 2025-11-21 13:41:18.062754
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a99966503c69'
+down_revision = 'a0f90267ca4d'
+branch_labels = None
+depends_on = None
+
+# (child table, FK column, parent table); constraint names are Postgres defaults
+CASCADE_FOREIGN_KEYS = (
+    ("search_opinioncluster", "docket_id", "search_docket"),
+    ("people_db_position", "person_id", "people_db_person"),
+    ("people_db_education", "person_id", "people_db_person"),
+    ("people_db_politicalaffiliation", "person_id", "people_db_person"),
+    ("people_db_race", "person_id", "people_db_person"),
+    ("people_db_source", "person_id", "people_db_person"),
+)
+
+
+def _replace_foreign_keys(on_delete: str) -> None:
+    for table, column, parent in CASCADE_FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        # NOT VALID skips the full-table check while the ALTER holds its
+        # exclusive lock; VALIDATE then scans under a weaker lock
+        op.execute(f"""
+            ALTER TABLE {table}
+            DROP CONSTRAINT IF EXISTS {name},
+            ADD CONSTRAINT {name} FOREIGN KEY ({column})
+                REFERENCES {parent} (id) {on_delete} NOT VALID
+        """)
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def upgrade() -> None:
+    # Lets the ORM relationships use passive_deletes=True: child rows are
+    # removed by one set-based delete instead of being loaded and deleted
+    # one at a time
+    _replace_foreign_keys("ON DELETE CASCADE")
+
+
+def downgrade() -> None:
+    _replace_foreign_keys("")
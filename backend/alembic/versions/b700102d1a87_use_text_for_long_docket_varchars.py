@@ -0,0 +1,41 @@
+"""Use text for long free-form docket varchar columns
+
+Revision ID: b700102d1a87
+Revises: 9cdee1c441c4
+Create Date: 2025-11-21 09:22:05.163480
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b700102d1a87'
+down_revision = '9cdee1c441c4'
+branch_labels = None
+depends_on = None
+
+# Column -> previous varchar length
+TEXT_COLUMNS = {
+    "cause": 2000,
+    "nature_of_suit": 1000,
+    "jury_demand": 500,
+    "filepath_local": 1000,
+    "filepath_ia": 1000,
+    "filepath_ia_json": 1000,
+}
+
+
+def upgrade() -> None:
+    # varchar -> text is binary compatible, so this only updates the catalog
+    # (no table rewrite, no index rebuild)
+    columns = ", ".join(f"ALTER COLUMN {column} TYPE text" for column in TEXT_COLUMNS)
+    op.execute(f"ALTER TABLE search_docket {columns}")
+
+
+def downgrade() -> None:
+    columns = ", ".join(
+        f"ALTER COLUMN {column} TYPE varchar({length})"
+        for column, length in TEXT_COLUMNS.items()
+    )
+    op.execute(f"ALTER TABLE search_docket {columns}")
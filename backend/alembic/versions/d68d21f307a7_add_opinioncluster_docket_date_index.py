@@ -0,0 +1,30 @@
+"""Add opinion cluster (docket_id, date_filed DESC) covering index
+
+Revision ID: d68d21f307a7
+Revises: a1b2c3d4e5f6
+Create Date: 2025-11-14 10:12:31.418204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd68d21f307a7'
+down_revision = 'a1b2c3d4e5f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves GET /api/dockets/{id}/opinions: rows come back already ordered by
+    # date_filed DESC and the INCLUDE columns allow an index-only scan.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_opinion_docket_date
+        ON search_opinioncluster (docket_id, date_filed DESC)
+        INCLUDE (id, case_name, judges, precedential_status, citation_count, slug)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_opinion_docket_date")
@@ -0,0 +1,53 @@
+"""Add materialized views for opinion status and timeline stats
+
+Revision ID: e90bbabf89d6
+Revises: 09d047634f43
+Create Date: 2025-11-18 11:05:39.527716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e90bbabf89d6'
+down_revision = '09d047634f43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Pre-aggregated data for /api/opinions/stats/by-status and
+    # /stats/timeline, refreshed by app.services.opinion_stats after imports.
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_opinion_status AS
+        SELECT precedential_status, COUNT(*) AS count
+        FROM search_opinioncluster
+        WHERE precedential_status IS NOT NULL
+        GROUP BY precedential_status
+    """)
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_opinion_timeline AS
+        SELECT d.court_id, EXTRACT(year FROM oc.date_filed)::int AS year, COUNT(*) AS count
+        FROM search_opinioncluster oc
+        JOIN search_docket d ON d.id = oc.docket_id
+        WHERE oc.date_filed IS NOT NULL
+        GROUP BY d.court_id, EXTRACT(year FROM oc.date_filed)::int
+    """)
+
+    # REFRESH ... CONCURRENTLY requires a unique index
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_opinion_status_status
+        ON mv_opinion_status (precedential_status)
+    """)
+
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_opinion_timeline_court_year
+        ON mv_opinion_timeline (court_id, year)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_opinion_timeline")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_opinion_status")
@@ -0,0 +1,38 @@
+"""Add composite indexes for blocked and precedential status filters
+
+Revision ID: f850bc04f947
+Revises: a7aa73d3ef6f
+Create Date: 2025-11-20 10:14:27.559301
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f850bc04f947'
+down_revision = 'a7aa73d3ef6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (court_id, date_filed) on dockets and (docket_id, date_filed) on opinion
+    # clusters already exist as idx_docket_court_date / idx_opinion_docket_date.
+
+    # Docket list filtered by blocked, ordered by date_filed
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_docket_blocked_date
+        ON search_docket (blocked, date_filed)
+    """)
+
+    # Opinion list filtered by precedential_status, ordered by citation_count
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_opinion_status_citation
+        ON search_opinioncluster (precedential_status, citation_count)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_opinion_status_citation")
+    op.execute("DROP INDEX IF EXISTS idx_docket_blocked_date")
@@ -0,0 +1,19 @@
+"""
+Response Helpers
+
+Shared helpers for routes that return pre-serialized JSON.
+"""
+from typing import Union
+
+from fastapi import Response
+
+
+def json_payload_response(payload: Union[str, bytes]) -> Response:
+    """
+    Return an already-serialized JSON payload without re-encoding it.
+
+    FastAPI passes Response objects through untouched, so this also skips the
+    response_model dump/validate/serialize round trip. The route's
+    response_model is still used for the OpenAPI schema.
+    """
+    return Response(content=payload, media_type="application/json")
@@ -15,7 +15,6 @@ from app.schemas.data_management import (
     ChunkRequest,
     ChunkListResponse,
     ChunkStartResponse,
-    ChunkInfo,
     ChunkProgressSummary,
     ChunkedImportRequest,
     ChunkedImportResponse,
@@ -177,10 +176,12 @@ async def list_chunks(
             db_session=db
         )
 
+        # The chunk dicts are validated into ChunkInfo in the same pass as
+        # the response instead of one constructor call per chunk
         return ChunkListResponse(
             table_name=table_name,
             dataset_date=dataset_date,
-            chunks=[ChunkInfo(**chunk) for chunk in chunks],
+            chunks=chunks,
             total_chunks=len(chunks)
         )
 
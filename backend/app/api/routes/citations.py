@@ -12,17 +12,27 @@ import logging
 from app.api.deps import get_db
 from app.models import Citation, OpinionCluster, Docket
 from app.schemas.citation import (
-    CitationListItem,
-    CitationNetworkNode,
-    CitationNetworkEdge,
+    CitationNetworkEdgeList,
+    CitationNetworkNodeList,
     CitationNetworkResponse,
-    CitationStatsResponse,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _network_node(opinion_id: int, row) -> dict:
+    """Build a citation network node from an OpinionCluster or a joined result row."""
+    return {
+        "id": opinion_id,
+        "opinion_id": opinion_id,
+        "case_name": row.case_name or "Unknown",
+        "date_filed": str(row.date_filed) if row.date_filed else None,
+        "citation_count": row.citation_count or 0,
+        "precedential_status": row.precedential_status,
+    }
+
+
 @router.get("/{opinion_id}/citing")
 async def get_citing_opinions(
     opinion_id: int,
@@ -270,20 +280,14 @@ async def get_citation_network(
         if not center_opinion:
             raise HTTPException(status_code=404, detail=f"Opinion {opinion_id} not found")
 
-        # Track visited opinion IDs and nodes
+        # Track visited opinion IDs and nodes; nodes and edges are collected
+        # as plain dicts and validated in one pass at the end
         visited: Set[int] = {opinion_id}
-        nodes: Dict[int, CitationNetworkNode] = {}
-        edges: List[CitationNetworkEdge] = []
+        nodes: Dict[int, dict] = {}
+        edges: List[dict] = []
 
         # Add center node
-        nodes[opinion_id] = CitationNetworkNode(
-            id=opinion_id,
-            opinion_id=opinion_id,
-            case_name=center_opinion.case_name or "Unknown",
-            date_filed=str(center_opinion.date_filed) if center_opinion.date_filed else None,
-            citation_count=center_opinion.citation_count or 0,
-            precedential_status=center_opinion.precedential_status,
-        )
+        nodes[opinion_id] = _network_node(opinion_id, center_opinion)
 
         # BFS to explore citation network
         current_level = [opinion_id]
@@ -321,22 +325,15 @@ async def get_citation_network(
 
                     if c.citing_opinion_id not in visited:
                         visited.add(c.citing_opinion_id)
-                        nodes[c.citing_opinion_id] = CitationNetworkNode(
-                            id=c.citing_opinion_id,
-                            opinion_id=c.citing_opinion_id,
-                            case_name=c.case_name or "Unknown",
-                            date_filed=str(c.date_filed) if c.date_filed else None,
-                            citation_count=c.citation_count or 0,
-                            precedential_status=c.precedential_status,
-                        )
+                        nodes[c.citing_opinion_id] = _network_node(c.citing_opinion_id, c)
                         next_level.append(c.citing_opinion_id)
 
                     # Add edge
-                    edges.append(CitationNetworkEdge(
-                        source=c.citing_opinion_id,
-                        target=current_id,
-                        depth=c.depth or 1
-                    ))
+                    edges.append({
+                        "source": c.citing_opinion_id,
+                        "target": current_id,
+                        "depth": c.depth or 1,
+                    })
 
                 # Get opinions cited by this one (outgoing edges)
                 cited = db.query(
@@ -361,28 +358,21 @@ async def get_citation_network(
 
                     if c.cited_opinion_id not in visited:
                         visited.add(c.cited_opinion_id)
-                        nodes[c.cited_opinion_id] = CitationNetworkNode(
-                            id=c.cited_opinion_id,
-                            opinion_id=c.cited_opinion_id,
-                            case_name=c.case_name or "Unknown",
-                            date_filed=str(c.date_filed) if c.date_filed else None,
-                            citation_count=c.citation_count or 0,
-                            precedential_status=c.precedential_status,
-                        )
+                        nodes[c.cited_opinion_id] = _network_node(c.cited_opinion_id, c)
                         next_level.append(c.cited_opinion_id)
 
                     # Add edge
-                    edges.append(CitationNetworkEdge(
-                        source=current_id,
-                        target=c.cited_opinion_id,
-                        depth=c.depth or 1
-                    ))
+                    edges.append({
+                        "source": current_id,
+                        "target": c.cited_opinion_id,
+                        "depth": c.depth or 1,
+                    })
 
             current_level = next_level
 
-        return CitationNetworkResponse(
-            nodes=list(nodes.values()),
-            edges=edges,
+        return CitationNetworkResponse.model_construct(
+            nodes=CitationNetworkNodeList.validate_python(list(nodes.values())),
+            edges=CitationNetworkEdgeList.validate_python(edges),
             center_opinion_id=opinion_id,
             max_depth=max_depth
         )
@@ -6,7 +6,9 @@ Endpoints for managing data downloads and imports.
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from pathlib import Path
 import logging
+import time
 from app.api.deps import get_db
 
 logger = logging.getLogger(__name__)
@@ -21,9 +23,11 @@ from app.schemas.data_management import (
     ImportProgressResponse,
     TableImportProgress,
 )
-from app.services.s3_downloader import CourtListenerDownloader
+from app.services.s3_downloader import get_downloader
 from app.services.data_importer import DataImporter
 from app.services.data_validator import DataValidator
+from app.services.row_counts import table_row_estimates
+from app.services.post_import import finish_import
 from app.celery_app import celery_app
 from app.tasks.download_tasks import download_dataset_task
 from app.tasks.import_tasks import import_dataset_task
@@ -34,15 +38,88 @@ from sqlalchemy import func
 router = APIRouter()
 
 # Initialize services
-downloader = CourtListenerDownloader()
 importer = DataImporter()
 validator = DataValidator()
 
+# Import order is static, so build the read-only views used by the status
+# endpoint once instead of on every poll.
+_IMPORT_ORDER_TUPLE = tuple(importer.IMPORT_ORDER)
+_IMPORT_ORDER_LEN = len(_IMPORT_ORDER_TUPLE)
+
+# DatabaseStatus count field -> table it counts
+STATUS_TABLES = {
+    "total_people": Person.__tablename__,
+    "total_positions": Position.__tablename__,
+    "total_schools": School.__tablename__,
+    "total_educations": Education.__tablename__,
+    "total_dockets": Docket.__tablename__,
+    "total_opinion_clusters": OpinionCluster.__tablename__,
+    "total_citations": Citation.__tablename__,
+    "total_parentheticals": Parenthetical.__tablename__,
+}
+
+# Expected row counts for the import progress endpoint, from the CSV files
+# (excluding header row)
+IMPORT_PROGRESS_EXPECTED = {
+    "search_docket": 69992974,
+    "search_opinioncluster": 74582772,
+    "search_opinionscited": 75814101,
+    "search_parenthetical": 6117877,
+}
+
+# Every poller within this window gets the same response instance; the
+# estimates behind it only move when autovacuum re-analyzes the tables
+IMPORT_PROGRESS_CACHE_TTL = 5  # seconds
+_import_progress_cache: dict = {"expires": 0.0, "response": None}
+
+# Shared empty value for status branches that report no records; ImportStatus
+# copies its inputs on validation, so it is never mutated.
+_EMPTY_DICT: dict = {}
+
 # In-memory task storage (in production, use Redis or database)
 download_tasks: dict[str, str] = {}  # Maps date to task_id
 import_tasks: dict[str, str] = {}  # Maps date to import task_id
 
 
+def launch_detached_script(script_path: str, log_path: str) -> int:
+    """
+    Start a Python import script as a detached process.
+
+    The child runs in its own session so it survives the HTTP request (and a
+    server restart), with stdout/stderr redirected to log_path. A daemon thread
+    waits on it so it is reaped when it exits instead of lingering as a zombie,
+    then runs the post-import hook.
+
+    Args:
+        script_path: Path to the Python script to run
+        log_path: File that receives the script's combined output
+
+    Returns:
+        PID of the started process
+    """
+    import subprocess
+    import sys
+    import threading
+
+    with open(log_path, "wb", buffering=0) as log_file:
+        proc = subprocess.Popen(
+            [sys.executable, script_path],
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+            cwd=str(Path(script_path).parent),
+        )
+
+    def wait_and_finish():
+        proc.wait()
+        finish_import()
+
+    threading.Thread(target=wait_and_finish, daemon=True).start()
+    return proc.pid
+
+
 @router.get("/datasets", response_model=AvailableDatasetsResponse)
 async def list_available_datasets():
     """
@@ -52,8 +129,8 @@ async def list_available_datasets():
     available for download.
     """
     try:
-        datasets = downloader.list_available_datasets()
-        dates = downloader.get_available_dates()
+        datasets = get_downloader().list_available_datasets()
+        dates = get_downloader().get_available_dates()
         
         dataset_info = [
             DatasetInfo(**dataset) for dataset in datasets
@@ -76,7 +153,7 @@ async def get_datasets_for_date(date: str):
         date: Date string in format YYYY-MM-DD
     """
     try:
-        files = downloader.get_files_for_date(date)
+        files = get_downloader().get_files_for_date(date)
         all_files = []
         
         for file_type, file_list in files.items():
@@ -187,13 +264,13 @@ async def get_download_status(date: str):
         )
     
     # No active task - check if files exist locally
-    files = downloader.get_files_for_date(date)
+    files = get_downloader().get_files_for_date(date)
     
     files_status = {}
     for file_type, file_list in files.items():
         for file_info in file_list:
             filename = file_info['key'].split('/')[-1]
-            exists = downloader.file_exists_locally(filename)
+            exists = get_downloader().file_exists_locally(filename)
             files_status[filename] = {
                 "status": "completed" if exists else "pending",
                 "exists": exists
@@ -216,17 +293,10 @@ async def get_database_status(db: Session = Depends(get_db)):
         db: Database session
     """
     try:
-        # Get record counts for people database
-        total_people = db.query(func.count(Person.id)).scalar() or 0
-        total_positions = db.query(func.count(Position.id)).scalar() or 0
-        total_schools = db.query(func.count(School.id)).scalar() or 0
-        total_educations = db.query(func.count(Education.id)).scalar() or 0
-
-        # Get record counts for case law database
-        total_dockets = db.query(func.count(Docket.id)).scalar() or 0
-        total_opinion_clusters = db.query(func.count(OpinionCluster.id)).scalar() or 0
-        total_citations = db.query(func.count(Citation.id)).scalar() or 0
-        total_parentheticals = db.query(func.count(Parenthetical.id)).scalar() or 0
+        # Record counts come from planner statistics in a single catalog
+        # query; small tables are still counted exactly
+        counts = table_row_estimates(db, STATUS_TABLES.values())
+        totals = {field: counts[table] for field, table in STATUS_TABLES.items()}
 
         # Get database size (PostgreSQL specific)
         db_size_result = db.execute(
@@ -238,18 +308,11 @@ async def get_database_status(db: Session = Depends(get_db)):
         # TODO: Store last import date in a metadata table
         # For now, check if we have any data
         last_import_date = None
-        has_data = total_people > 0 or total_dockets > 0
+        has_data = totals["total_people"] > 0 or totals["total_dockets"] > 0
         last_import_status = "no_data" if not has_data else "has_data"
 
         return DatabaseStatus(
-            total_people=total_people,
-            total_positions=total_positions,
-            total_schools=total_schools,
-            total_educations=total_educations,
-            total_dockets=total_dockets,
-            total_opinion_clusters=total_opinion_clusters,
-            total_citations=total_citations,
-            total_parentheticals=total_parentheticals,
+            **totals,
             last_import_date=last_import_date,
             last_import_status=last_import_status,
             database_size_mb=round(db_size_mb, 2) if db_size_mb else None
@@ -258,76 +321,51 @@ async def get_database_status(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error getting database status: {str(e)}")
 
 
+def _table_import_progress(table_name: str, current: int, expected: int) -> TableImportProgress:
+    """Build a table's progress entry, deriving status and percentage from its counts."""
+    if current == 0:
+        status, progress = "pending", 0.0
+    elif current >= expected:
+        status, progress = "completed", 100.0
+    else:
+        status, progress = "importing", round((current / expected) * 100, 2)
+
+    return TableImportProgress(
+        table_name=table_name,
+        current_count=current,
+        expected_count=expected,
+        status=status,
+        progress_percent=progress,
+    )
+
+
 @router.get("/import-progress", response_model=ImportProgressResponse)
 async def get_import_progress(db: Session = Depends(get_db)):
     """
     Get real-time import progress for case law tables.
 
     Returns current row counts for all 4 case law tables to monitor import progress.
-    Designed for manual polling by the user.
+    Designed for manual polling by the user. Counts are pg_class estimates
+    (see row_counts.table_row_estimates), not COUNT(*) scans, and one response
+    is shared by all pollers for IMPORT_PROGRESS_CACHE_TTL seconds.
 
     Args:
         db: Database session
     """
-    try:
-        # Expected row counts from CSV files (excluding header row)
-        EXPECTED_COUNTS = {
-            "search_docket": 69992974,
-            "search_opinioncluster": 74582772,
-            "search_opinionscited": 75814101,
-            "search_parenthetical": 6117877
-        }
+    now = time.monotonic()
+    if _import_progress_cache["expires"] > now:
+        return _import_progress_cache["response"]
 
-        # Query current row counts for all case law tables
-        docket_count = db.query(func.count(Docket.id)).scalar() or 0
-        cluster_count = db.query(func.count(OpinionCluster.id)).scalar() or 0
-        citation_count = db.query(func.count(Citation.id)).scalar() or 0
-        parenthetical_count = db.query(func.count(Parenthetical.id)).scalar() or 0
-
-        def get_status_and_progress(current: int, expected: int) -> tuple[str, float]:
-            """Determine status and progress percentage."""
-            if current == 0:
-                return "pending", 0.0
-            elif current >= expected:
-                return "completed", 100.0
-            else:
-                return "importing", round((current / expected) * 100, 2)
-
-        docket_status, docket_progress = get_status_and_progress(docket_count, EXPECTED_COUNTS["search_docket"])
-        cluster_status, cluster_progress = get_status_and_progress(cluster_count, EXPECTED_COUNTS["search_opinioncluster"])
-        citation_status, citation_progress = get_status_and_progress(citation_count, EXPECTED_COUNTS["search_opinionscited"])
-        parenthetical_status, parenthetical_progress = get_status_and_progress(parenthetical_count, EXPECTED_COUNTS["search_parenthetical"])
-
-        return ImportProgressResponse(
-            search_docket=TableImportProgress(
-                table_name="search_docket",
-                current_count=docket_count,
-                expected_count=EXPECTED_COUNTS["search_docket"],
-                status=docket_status,
-                progress_percent=docket_progress
-            ),
-            search_opinioncluster=TableImportProgress(
-                table_name="search_opinioncluster",
-                current_count=cluster_count,
-                expected_count=EXPECTED_COUNTS["search_opinioncluster"],
-                status=cluster_status,
-                progress_percent=cluster_progress
-            ),
-            search_opinionscited=TableImportProgress(
-                table_name="search_opinionscited",
-                current_count=citation_count,
-                expected_count=EXPECTED_COUNTS["search_opinionscited"],
-                status=citation_status,
-                progress_percent=citation_progress
-            ),
-            search_parenthetical=TableImportProgress(
-                table_name="search_parenthetical",
-                current_count=parenthetical_count,
-                expected_count=EXPECTED_COUNTS["search_parenthetical"],
-                status=parenthetical_status,
-                progress_percent=parenthetical_progress
-            )
-        )
+    try:
+        counts = table_row_estimates(db, IMPORT_PROGRESS_EXPECTED)
+
+        response = ImportProgressResponse(**{
+            table: _table_import_progress(table, counts[table], expected)
+            for table, expected in IMPORT_PROGRESS_EXPECTED.items()
+        })
+        _import_progress_cache["expires"] = now + IMPORT_PROGRESS_CACHE_TTL
+        _import_progress_cache["response"] = response
+        return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting import progress: {str(e)}")
 
@@ -422,7 +460,7 @@ def import_caselaw_sync():
                 # Check if file exists
                 if not target_path.exists():
                     logger.info(f"[{table_name}] Downloading from S3: {s3_file}")
-                    downloaded_path = downloader.download_file(
+                    downloaded_path = get_downloader().download_file(
                         key=f"bulk-data/{s3_file}",
                         target_path=target_path
                     )
@@ -454,6 +492,7 @@ def import_caselaw_sync():
                 })
 
         session.close()
+        finish_import()
 
         logger.info("=" * 80)
         logger.info("CASELAW IMPORT COMPLETE")
@@ -542,7 +581,7 @@ async def parallel_import_from_s3(date: str):
             data_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
 
             target_path = data_dir / f"{table_name}-{date}.csv"
-            downloaded_path = downloader.download_file(
+            downloaded_path = get_downloader().download_file(
                 key=f"bulk-data/{s3_file}",
                 target_path=target_path
             )
@@ -581,6 +620,7 @@ async def parallel_import_from_s3(date: str):
     ]
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
+    finish_import()
 
     logger.info("=" * 80)
     logger.info("PARALLEL IMPORT COMPLETE")
@@ -638,7 +678,7 @@ def import_people_database_sync():
                 target_path = data_dir / f"{table_name}-{date}.csv"
 
                 # Download
-                downloaded_path = downloader.download_file(
+                downloaded_path = get_downloader().download_file(
                     key=f"bulk-data/{s3_file}",
                     target_path=target_path
                 )
@@ -687,6 +727,7 @@ def import_people_database_sync():
                 })
 
         session.close()
+        finish_import()
 
         logger.info("=" * 80)
         logger.info("PEOPLE DATABASE IMPORT COMPLETE")
@@ -775,7 +816,7 @@ async def import_people_database_tables(date: str):
             data_dir.mkdir(parents=True, exist_ok=True)
 
             target_path = data_dir / f"{table_name}-{date}.csv"
-            downloaded_path = downloader.download_file(
+            downloaded_path = get_downloader().download_file(
                 key=f"bulk-data/{s3_file}",
                 target_path=target_path
             )
@@ -825,6 +866,7 @@ async def import_people_database_tables(date: str):
     ]
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
+    finish_import()
 
     logger.info("=" * 80)
     logger.info("PEOPLE DATABASE IMPORT COMPLETE")
@@ -871,22 +913,22 @@ async def get_import_status(date: str, db: Session = Depends(get_db)):
                 status = "pending"
                 progress = 0.0
                 current_table = None
-                tables_completed = []
-                records_imported = {}
+                tables_completed = ()
+                records_imported = _EMPTY_DICT
             elif task_state == 'PROGRESS':
                 status = "importing"
                 meta = task.info or {}
                 progress = meta.get('progress', 0.0)
                 current_table = meta.get('current_table')
-                tables_completed = meta.get('tables_completed', [])
-                records_imported = meta.get('records_imported', {})
+                tables_completed = meta.get('tables_completed', ())
+                records_imported = meta.get('records_imported', _EMPTY_DICT)
             elif task_state == 'SUCCESS':
                 status = "completed"
                 result = task.result or {}
                 progress = 1.0
                 current_table = None
-                tables_completed = result.get('tables_completed', [])
-                records_imported = result.get('records_imported', {})
+                tables_completed = result.get('tables_completed', ())
+                records_imported = result.get('records_imported', _EMPTY_DICT)
                 # Remove completed task from tracking
                 import_tasks.pop(date, None)
             else:  # FAILURE
@@ -898,8 +940,8 @@ async def get_import_status(date: str, db: Session = Depends(get_db)):
                     error = 'Import task failed'
                 progress = 0.0
                 current_table = None
-                tables_completed = []
-                records_imported = {}
+                tables_completed = ()
+                records_imported = _EMPTY_DICT
                 # Remove failed task from tracking
                 import_tasks.pop(date, None)
 
@@ -923,15 +965,15 @@ async def get_import_status(date: str, db: Session = Depends(get_db)):
             return ImportStatus(
                 status="completed",
                 date=date,
-                tables_completed=list(importer.IMPORT_ORDER),
-                tables_total=len(importer.IMPORT_ORDER),
+                tables_completed=_IMPORT_ORDER_TUPLE,
+                tables_total=_IMPORT_ORDER_LEN,
                 progress=1.0
             )
         else:
             return ImportStatus(
                 status="pending",
                 date=date,
-                tables_total=len(importer.IMPORT_ORDER),
+                tables_total=_IMPORT_ORDER_LEN,
                 progress=0.0
             )
     except Exception as e:
@@ -941,14 +983,11 @@ async def get_import_status(date: str, db: Session = Depends(get_db)):
 @router.post("/import-caselaw-background")
 def import_caselaw_background():
     """
-    Start caselaw import as a detached background process using nohup.
+    Start caselaw import as a detached background process.
     This endpoint returns immediately and the import runs independently.
 
     Monitor progress via /api/monitoring/import/live-status
     """
-    import subprocess
-    from pathlib import Path
-
     try:
         # Path to the import script
         script_path = "/app/import_directly.py"
@@ -958,24 +997,16 @@ def import_caselaw_background():
         if not Path(script_path).exists():
             raise FileNotFoundError(f"Import script not found: {script_path}")
 
-        # Use nohup and shell redirect to truly background the process
-        # This ensures the process survives after the HTTP request completes
-        cmd = f"nohup python3 {script_path} > {log_path} 2>&1 &"
-
-        # Execute via shell to get proper backgrounding
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True
-        )
+        # Detach in a new session so the process survives after the HTTP request completes
+        pid = launch_detached_script(script_path, log_path)
 
-        logger.info(f"Started caselaw import with nohup (command: {cmd})")
+        logger.info(f"Started caselaw import (script: {script_path}, pid: {pid})")
         logger.info(f"Logs will be written to: {log_path}")
 
         return {
             "status": "started",
-            "message": "Caselaw import started in background with nohup",
+            "message": "Caselaw import started in background",
+            "pid": pid,
             "log_file": log_path,
             "note": "Monitor progress at /api/monitoring/import/live-status or GET /api/data/import-logs"
         }
@@ -1078,9 +1109,6 @@ def import_citations_parallel():
     This endpoint starts search_opinionscited import which has no FK dependencies
     and can run simultaneously with dockets for faster completion.
     """
-    import subprocess
-    from pathlib import Path
-
     try:
         script_path = "/app/import_citations_parallel.py"
         log_path = "/app/data/import_citations.log"
@@ -1089,22 +1117,16 @@ def import_citations_parallel():
         if not Path(script_path).exists():
             raise FileNotFoundError(f"Citations import script not found: {script_path}")
 
-        # Use nohup to run in background
-        cmd = f"nohup python3 {script_path} > {log_path} 2>&1 &"
+        # Detach so the import runs in the background
+        pid = launch_detached_script(script_path, log_path)
 
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True
-        )
-
-        logger.info(f"Started parallel citations import (command: {cmd})")
+        logger.info(f"Started parallel citations import (script: {script_path}, pid: {pid})")
         logger.info(f"Logs will be written to: {log_path}")
 
         return {
             "status": "started",
             "message": "Citations import started in parallel with dockets",
+            "pid": pid,
             "log_file": log_path,
             "note": "This will run alongside the dockets import for faster completion"
         }
@@ -1125,9 +1147,6 @@ def import_ultra_turbo():
 
     Expected performance: 200K-500K rows/min (vs 50K-100K with INSERT)
     """
-    import subprocess
-    from pathlib import Path
-
     try:
         script_path = "/app/import_ultra_turbo.py"
         log_path = "/app/data/import_ultra_turbo.log"
@@ -1136,22 +1155,16 @@ def import_ultra_turbo():
         if not Path(script_path).exists():
             raise FileNotFoundError(f"Ultra turbo import script not found: {script_path}")
 
-        # Use nohup to run in background
-        cmd = f"nohup python3 {script_path} > {log_path} 2>&1 &"
-
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True
-        )
+        # Detach so the import runs in the background
+        pid = launch_detached_script(script_path, log_path)
 
-        logger.info(f"Started ULTRA TURBO import (command: {cmd})")
+        logger.info(f"Started ULTRA TURBO import (script: {script_path}, pid: {pid})")
         logger.info(f"Logs will be written to: {log_path}")
 
         return {
             "status": "started",
             "message": "🚀 ULTRA TURBO MODE: PostgreSQL COPY started",
+            "pid": pid,
             "log_file": log_path,
             "features": [
                 "PostgreSQL native COPY command",
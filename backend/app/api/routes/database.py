@@ -4,11 +4,13 @@ Database Import/Export API Routes
 Endpoints for uploading and restoring PostgreSQL dumps
 """
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 import subprocess
 import os
 from pathlib import Path
 import logging
+from app.api.uploads import copy_upload, safe_upload_path
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -16,6 +18,9 @@ logger = logging.getLogger(__name__)
 DUMP_DIR = Path("/app/dumps")
 DUMP_DIR.mkdir(exist_ok=True)
 
+# Last dump listing, keyed by the directory mtime it was built from
+_dumps_cache: dict = {"mtime": None, "dumps": []}
+
 
 @router.post("/upload-dump")
 async def upload_dump(file: UploadFile = File(...)):
@@ -24,33 +29,38 @@ async def upload_dump(file: UploadFile = File(...)):
     Accepts pg_dump custom format (.pgdump) files.
     """
     try:
-        # Validate file extension
-        if not file.filename.endswith(('.pgdump', '.dump', '.sql')):
+        # Validate file name and extension
+        dump_path = safe_upload_path(DUMP_DIR, file.filename)
+        if not dump_path.name.endswith(('.pgdump', '.dump', '.sql')):
             raise HTTPException(
                 status_code=400,
                 detail="Invalid file format. Expected .pgdump, .dump, or .sql file"
             )
 
-        # Save the uploaded file
-        dump_path = DUMP_DIR / file.filename
-
-        logger.info(f"Receiving dump file: {file.filename}")
+        logger.info(f"Receiving dump file: {dump_path.name}")
 
-        with open(dump_path, "wb") as buffer:
-            chunk_size = 10 * 1024 * 1024  # 10MB chunks
-            while chunk := await file.read(chunk_size):
-                buffer.write(chunk)
+        # Write to a hidden temporary name and rename it into place, so the
+        # listing never sees a partial dump and the rename bumps the
+        # directory mtime that keys the listing cache
+        part_path = dump_path.with_name(f".{dump_path.name}.part")
+        try:
+            bytes_written = await run_in_threadpool(copy_upload, file.file, part_path)
+            os.replace(part_path, dump_path)
+        finally:
+            part_path.unlink(missing_ok=True)
 
-        file_size_mb = dump_path.stat().st_size / (1024 * 1024)
+        file_size_mb = bytes_written / (1024 * 1024)
         logger.info(f"Dump file saved: {dump_path} ({file_size_mb:.2f} MB)")
 
         return {
             "status": "success",
-            "filename": file.filename,
+            "filename": dump_path.name,
             "size_mb": round(file_size_mb, 2),
             "path": str(dump_path)
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error uploading dump: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -63,7 +73,7 @@ async def restore_dump(filename: str, background_tasks: BackgroundTasks):
     This runs in the background and returns immediately.
     """
     try:
-        dump_path = DUMP_DIR / filename
+        dump_path = safe_upload_path(DUMP_DIR, filename)
 
         if not dump_path.exists():
             raise HTTPException(
@@ -172,23 +182,43 @@ async def get_restore_status():
         }
 
 
+def _scan_dumps() -> list[dict]:
+    """
+    Build the dump listing, reusing the cached one if the directory is unchanged.
+
+    Uses os.scandir so each entry costs a single stat call. Runs in a worker
+    thread to keep filesystem I/O off the event loop.
+    """
+    dir_mtime = DUMP_DIR.stat().st_mtime
+    if _dumps_cache["mtime"] == dir_mtime:
+        return _dumps_cache["dumps"]
+
+    dumps = []
+    with os.scandir(DUMP_DIR) as entries:
+        for entry in entries:
+            # Dotfiles are uploads still in progress
+            if entry.is_file(follow_symlinks=False) and not entry.name.startswith("."):
+                stat = entry.stat(follow_symlinks=False)
+                dumps.append({
+                    "filename": entry.name,
+                    "size_mb": round(stat.st_size / (1024 * 1024), 2),
+                    "modified": stat.st_mtime
+                })
+
+    dumps.sort(key=lambda x: x["modified"], reverse=True)
+
+    _dumps_cache["mtime"] = dir_mtime
+    _dumps_cache["dumps"] = dumps
+    return dumps
+
+
 @router.get("/dumps")
 async def list_dumps():
     """
     List all available dump files on the server.
     """
     try:
-        dumps = []
-        for dump_file in DUMP_DIR.glob("*"):
-            if dump_file.is_file():
-                size_mb = dump_file.stat().st_size / (1024 * 1024)
-                dumps.append({
-                    "filename": dump_file.name,
-                    "size_mb": round(size_mb, 2),
-                    "modified": dump_file.stat().st_mtime
-                })
-
-        dumps.sort(key=lambda x: x["modified"], reverse=True)
+        dumps = await run_in_threadpool(_scan_dumps)
 
         return {
             "dumps": dumps,
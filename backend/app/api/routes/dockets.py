@@ -10,6 +10,8 @@ from typing import Optional, List
 import logging
 
 from app.api.deps import get_db
+from app.api.responses import json_payload_response
+from app.core.cache import DOCKETS_NAMESPACE, build_key, get_cached, set_cached
 from app.models import Docket, OpinionCluster, Court
 from app.schemas.docket import (
     DocketListItem,
@@ -21,6 +23,18 @@ from app.schemas.docket import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Exactly the columns DocketListItem needs (opinion_count is computed), so list
+# queries return plain rows instead of hydrating full Docket instances
+LIST_ITEM_FIELDS = tuple(name for name in DocketListItem.model_fields if name != "opinion_count")
+LIST_ITEM_COLUMNS = tuple(getattr(Docket, name) for name in LIST_ITEM_FIELDS)
+
+# Opinion fields returned by /{docket_id}/opinions. They match the INCLUDE
+# columns of idx_opinion_docket_date, so the lookup is an index-only scan.
+DOCKET_OPINION_FIELDS = (
+    "id", "case_name", "date_filed", "judges", "precedential_status", "citation_count", "slug",
+)
+DOCKET_OPINION_COLUMNS = tuple(getattr(OpinionCluster, name) for name in DOCKET_OPINION_FIELDS)
+
 
 @router.get("/", response_model=DocketSearchResponse)
 async def list_dockets(
@@ -35,6 +49,7 @@ async def list_dockets(
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     sort_by: str = Query("date_filed", description="Sort field"),
     sort_order: str = Query("desc", description="Sort order: asc or desc"),
+    include_total: bool = Query(False, description="Compute exact total and total_pages"),
 ):
     """
     List and search dockets with filtering and pagination.
@@ -44,10 +59,34 @@ async def list_dockets(
     - Filtering by court, date, judge, blocked status
     - Sorting by various fields
     - Pagination
+
+    The exact total requires a second scan of the filtered set, so it is only
+    computed when include_total is set; has_next is derived from fetching one
+    extra row.
+
+    Responses are cached briefly in Redis; the cache is invalidated when an
+    import completes.
     """
     try:
+        cache_key = await build_key(DOCKETS_NAMESPACE, {
+            "q": q,
+            "court_id": court_id,
+            "date_filed_after": date_filed_after,
+            "date_filed_before": date_filed_before,
+            "assigned_to_id": assigned_to_id,
+            "blocked": blocked,
+            "page": page,
+            "page_size": page_size,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+            "include_total": include_total,
+        })
+        cached = await get_cached(cache_key)
+        if cached:
+            return json_payload_response(cached)
+
         # Build base query
-        query = db.query(Docket)
+        query = db.query(*LIST_ITEM_COLUMNS)
 
         # Apply filters
         if q:
@@ -75,8 +114,8 @@ async def list_dockets(
         if blocked is not None:
             query = query.filter(Docket.blocked == blocked)
 
-        # Get total count before pagination
-        total = query.count()
+        # Get total count before pagination (only on request)
+        total = query.count() if include_total else None
 
         # Apply sorting
         sort_column = getattr(Docket, sort_by, Docket.date_filed)
@@ -85,31 +124,39 @@ async def list_dockets(
         else:
             query = query.order_by(sort_column.asc())
 
-        # Apply pagination
+        # Apply pagination, fetching one extra row to detect a next page
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        query = query.offset(offset).limit(page_size + 1)
 
         # Execute query
         dockets = query.all()
-
-        # Convert to response models
-        items = []
-        for docket in dockets:
-            # Get opinion count for this docket
-            opinion_count = db.query(func.count(OpinionCluster.id)).filter(
-                OpinionCluster.docket_id == docket.id
-            ).scalar() or 0
-
-            item = DocketListItem.model_validate(docket)
-            item.opinion_count = opinion_count
-            items.append(item)
+        has_next = len(dockets) > page_size
+        dockets = dockets[:page_size]
+
+        # Opinion counts for the whole page in one grouped query
+        # (served by idx_opinion_docket_date)
+        opinion_counts = dict(
+            db.query(OpinionCluster.docket_id, func.count())
+            .filter(OpinionCluster.docket_id.in_([d.id for d in dockets]))
+            .group_by(OpinionCluster.docket_id)
+            .all()
+        ) if dockets else {}
+
+        # Convert to response models; rows come straight from typed columns,
+        # so validation is skipped
+        items = [
+            DocketListItem.model_construct(
+                **dict(zip(LIST_ITEM_FIELDS, docket)),
+                opinion_count=opinion_counts.get(docket.id, 0),
+            )
+            for docket in dockets
+        ]
 
         # Calculate pagination metadata
-        total_pages = (total + page_size - 1) // page_size
-        has_next = page < total_pages
+        total_pages = (total + page_size - 1) // page_size if total is not None else None
         has_prev = page > 1
 
-        return DocketSearchResponse(
+        response = DocketSearchResponse(
             items=items,
             total=total,
             page=page,
@@ -118,6 +165,12 @@ async def list_dockets(
             has_next=has_next,
             has_prev=has_prev,
         )
+        # Serialize once for both the cache and the response; returning the
+        # model would make FastAPI re-validate every item against response_model
+        body = response.model_dump_json()
+        await set_cached(cache_key, body)
+
+        return json_payload_response(body)
 
     except Exception as e:
         logger.error(f"Error listing dockets: {str(e)}")
@@ -162,32 +215,29 @@ async def get_docket_opinions(
         docket_id: The ID of the docket
     """
     try:
-        # Verify docket exists
-        docket = db.query(Docket).filter(Docket.id == docket_id).first()
-        if not docket:
+        # Fetch the docket and its opinions in a single round trip. The outer
+        # join yields one row with a NULL cluster when the docket has none.
+        rows = db.query(
+            Docket.case_name.label("docket_case_name"), *DOCKET_OPINION_COLUMNS
+        ).outerjoin(
+            OpinionCluster, OpinionCluster.docket_id == Docket.id
+        ).filter(
+            Docket.id == docket_id
+        ).order_by(OpinionCluster.date_filed.desc()).all()
+
+        if not rows:
             raise HTTPException(status_code=404, detail=f"Docket {docket_id} not found")
 
-        # Get all opinions for this docket
-        opinions = db.query(OpinionCluster).filter(
-            OpinionCluster.docket_id == docket_id
-        ).order_by(OpinionCluster.date_filed.desc()).all()
+        case_name = rows[0].docket_case_name
+        opinions = [
+            dict(zip(DOCKET_OPINION_FIELDS, row[1:])) for row in rows if row.id is not None
+        ]
 
         return {
             "docket_id": docket_id,
-            "case_name": docket.case_name,
+            "case_name": case_name,
             "opinion_count": len(opinions),
-            "opinions": [
-                {
-                    "id": op.id,
-                    "case_name": op.case_name,
-                    "date_filed": op.date_filed,
-                    "judges": op.judges,
-                    "precedential_status": op.precedential_status,
-                    "citation_count": op.citation_count,
-                    "slug": op.slug,
-                }
-                for op in opinions
-            ]
+            "opinions": opinions,
         }
 
     except HTTPException:
@@ -210,36 +260,34 @@ async def get_docket_timeline(
     Returns aggregated counts by year and month.
     """
     try:
-        # Build query to aggregate by year and month
-        query = db.query(
-            func.extract('year', Docket.date_filed).label('year'),
-            func.extract('month', Docket.date_filed).label('month'),
-            func.count(Docket.id).label('count')
-        ).filter(Docket.date_filed.isnot(None))
+        # Aggregate by month; rows are streamed from a server-side cursor
+        month = func.date_trunc('month', Docket.date_filed).label('month')
+        stmt = select(
+            month,
+            func.count().label('count')
+        ).where(Docket.date_filed.isnot(None))
 
         # Apply filters
         if court_id:
-            query = query.filter(Docket.court_id == court_id)
+            stmt = stmt.where(Docket.court_id == court_id)
 
         if start_year:
-            query = query.filter(func.extract('year', Docket.date_filed) >= start_year)
+            stmt = stmt.where(func.extract('year', Docket.date_filed) >= start_year)
 
         if end_year:
-            query = query.filter(func.extract('year', Docket.date_filed) <= end_year)
+            stmt = stmt.where(func.extract('year', Docket.date_filed) <= end_year)
 
         # Group and order
-        query = query.group_by('year', 'month').order_by('year', 'month')
-
-        results = query.all()
+        stmt = stmt.group_by(month).order_by(month).execution_options(stream_results=True)
 
         return {
             "timeline": [
                 {
-                    "year": int(r.year),
-                    "month": int(r.month),
-                    "count": r.count
+                    "year": m.year,
+                    "month": m.month,
+                    "count": c
                 }
-                for r in results
+                for m, c in db.execute(stmt).yield_per(500)
             ]
         }
 
@@ -259,20 +307,24 @@ async def get_dockets_by_court(
     Returns the top courts by number of dockets.
     """
     try:
-        results = db.query(
+        stmt = select(
             Docket.court_id,
-            func.count(Docket.id).label('docket_count')
-        ).filter(
+            func.count().label('docket_count')
+        ).where(
             Docket.court_id.isnot(None)
         ).group_by(
             Docket.court_id
         ).order_by(
-            func.count(Docket.id).desc()
-        ).limit(limit).all()
+            func.count().desc()
+        ).limit(limit).execution_options(stream_results=True)
+
+        results = list(db.execute(stmt).yield_per(500))
 
         # Get court names
         court_ids = [r.court_id for r in results]
-        courts = db.query(Court).filter(Court.id.in_(court_ids)).all()
+        courts = db.query(Court.id, Court.full_name, Court.short_name).filter(
+            Court.id.in_(court_ids)
+        ).all()
         court_map = {c.id: c.full_name or c.short_name for c in courts}
 
         return {
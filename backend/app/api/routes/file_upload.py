@@ -4,9 +4,11 @@ File Upload API Routes
 Endpoints for uploading CSV files to the Railway volume.
 """
 from fastapi import APIRouter, File, UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pathlib import Path
 import shutil
 import logging
+from app.api.uploads import UPLOAD_BUFFER_SIZE, copy_upload, safe_upload_path
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -29,45 +31,41 @@ async def upload_csv_file(file: UploadFile = File(...)):
         Dictionary with upload status and file information
     """
     try:
-        # Validate file extension
-        if not file.filename.endswith('.csv'):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid file type. Only .csv files are allowed. Got: {file.filename}"
-            )
-
         # Construct target path
         data_dir = Path(settings.DATA_DIR)
         data_dir.mkdir(parents=True, exist_ok=True)
 
-        target_path = data_dir / file.filename
+        # Validate file name and extension
+        target_path = safe_upload_path(data_dir, file.filename)
+        if not target_path.name.endswith('.csv'):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid file type. Only .csv files are allowed. Got: {file.filename}"
+            )
 
         # Write file in chunks to handle large files
-        logger.info(f"[UPLOAD] Starting upload: {file.filename}")
-
-        with open(target_path, 'wb') as buffer:
-            chunk_size = 1024 * 1024  # 1MB chunks
-            bytes_written = 0
+        logger.info(f"[UPLOAD] Starting upload: {target_path.name}")
 
-            while chunk := await file.read(chunk_size):
-                buffer.write(chunk)
-                bytes_written += len(chunk)
+        def log_progress(bytes_written: int):
+            # Log progress every 100MB
+            if bytes_written % (100 * UPLOAD_BUFFER_SIZE) == 0:
+                logger.info(f"[UPLOAD] Progress: {bytes_written / (1024**3):.2f} GB")
 
-                # Log progress every 100MB
-                if bytes_written % (100 * 1024 * 1024) == 0:
-                    logger.info(f"[UPLOAD] Progress: {bytes_written / (1024**3):.2f} GB")
+        bytes_written = await run_in_threadpool(copy_upload, file.file, target_path, log_progress)
 
-        file_size_gb = target_path.stat().st_size / (1024**3)
-        logger.info(f"[UPLOAD] Complete: {file.filename} ({file_size_gb:.2f} GB)")
+        file_size_gb = bytes_written / (1024**3)
+        logger.info(f"[UPLOAD] Complete: {target_path.name} ({file_size_gb:.2f} GB)")
 
         return {
             "status": "success",
-            "filename": file.filename,
+            "filename": target_path.name,
             "path": str(target_path),
             "size_gb": round(file_size_gb, 2),
-            "message": f"File uploaded successfully: {file.filename}"
+            "message": f"File uploaded successfully: {target_path.name}"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"[UPLOAD] Error uploading {file.filename}: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
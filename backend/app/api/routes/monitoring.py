@@ -3,34 +3,219 @@ Monitoring API Routes
 
 Endpoints for monitoring database import progress and system status
 """
-from fastapi import APIRouter, Depends
-from sqlalchemy import text
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Awaitable, Callable, Final, Mapping
+import asyncio
+import time
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, text
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_monitoring_db, monitoring_engine
+from app.services.import_progress import get_import_progress_counts
 
 router = APIRouter()
 
+# Tables the monitoring endpoints may count. Each gets one static COUNT
+# statement built at import time, so no SQL is assembled per request.
+ALLOWED_TABLES = (
+    "search_docket",
+    "search_opinioncluster",
+    "search_opinionscited",
+    "search_parenthetical",
+    "people_db_court",
+    "people_db_person",
+)
+COUNT_STMTS = {table: text(f"SELECT COUNT(*) FROM {table}") for table in ALLOWED_TABLES}
+
+# Expected final row counts (from the local source database)
+EXPECTED_COUNTS: Final[Mapping[str, int]] = MappingProxyType({
+    "search_docket": 70000000,  # ~70M
+    "search_opinioncluster": 6000000,  # ~6M
+    "search_opinionscited": 76000000,  # ~76M
+    "search_parenthetical": 6000000,  # ~6M
+    "people_db_court": 3355,
+    "people_db_person": 16191,
+})
+
+# Overall progress only tracks the four bulk-imported case law tables
+EXPECTED_LARGE_COUNTS: Final[Mapping[str, int]] = MappingProxyType({
+    table: EXPECTED_COUNTS[table]
+    for table in (
+        "search_docket",
+        "search_opinioncluster",
+        "search_opinionscited",
+        "search_parenthetical",
+    )
+})
+TOTAL_EXPECTED_LARGE: Final[int] = sum(EXPECTED_LARGE_COUNTS.values())
+
+# Fixed pg_stat_activity queries polled by the dashboards. They are PREPAREd
+# once per monitoring connection so each poll only pays for EXECUTE. Monitoring
+# connections (application_name 'monitoring') are filtered out by name rather
+# than by LIKE matching on query text.
+PREPARED_QUERIES = {
+    "monitoring_connection_stats": """
+        SELECT
+            count(*) as connection_count,
+            count(*) FILTER (WHERE state = 'active') as active_queries,
+            count(*) FILTER (WHERE state = 'idle') as idle_connections
+        FROM pg_stat_activity
+        WHERE datname = current_database()
+    """,
+    "monitoring_long_queries": """
+        SELECT
+            pid,
+            query,
+            state,
+            EXTRACT(EPOCH FROM (now() - query_start)) as duration_seconds
+        FROM pg_stat_activity
+        WHERE
+            datname = current_database()
+            AND state = 'active'
+            AND backend_type = 'client backend'
+            AND application_name <> 'monitoring'
+        ORDER BY query_start
+        LIMIT 10
+    """,
+}
+
+
+# Everything /import/live-status needs - table counts, active queries and the
+# server time - in one round trip. Not prepared: it depends on
+# mv_import_progress, which may not exist until migrations have run.
+LIVE_STATUS_SQL = text(r"""
+    WITH counts AS (
+        SELECT table_name, current_count FROM mv_import_progress
+    ),
+    active AS (
+        SELECT
+            pid,
+            substring(query, 1, 100) AS query_preview,
+            (regexp_match(query, 'INSERT INTO\s+"?([A-Za-z0-9_]+)'))[1] AS target_table,
+            EXTRACT(EPOCH FROM (now() - query_start)) AS duration_seconds
+        FROM pg_stat_activity
+        WHERE state = 'active'
+        AND backend_type = 'client backend'
+        AND application_name <> 'monitoring'
+        ORDER BY query_start
+        LIMIT 10
+    )
+    SELECT json_build_object(
+        'counts', (SELECT coalesce(json_object_agg(table_name, current_count), '{}') FROM counts),
+        'active', (SELECT coalesce(json_agg(a ORDER BY a.duration_seconds DESC), '[]') FROM active a),
+        'now', now()
+    )
+""")
+
+
+CONNECTION_STATS = text("EXECUTE monitoring_connection_stats")
+LONG_QUERIES = text("EXECUTE monitoring_long_queries")
+
+DATABASE_SIZE = text("""
+    SELECT pg_size_pretty(pg_database_size(current_database())) as size
+""")
+
+TABLE_SIZES = text("""
+    SELECT relname, pg_size_pretty(pg_total_relation_size(oid)) as size
+    FROM pg_class
+    WHERE relkind = 'r' AND relname = ANY(:names)
+""")
+
+
+@event.listens_for(monitoring_engine, "connect")
+def prepare_monitoring_queries(dbapi_connection, connection_record):
+    """PREPARE the monitoring queries on every new monitoring connection."""
+    cursor = dbapi_connection.cursor()
+    for name, sql in PREPARED_QUERIES.items():
+        cursor.execute(f"PREPARE {name} AS {sql}")
+    cursor.close()
+    dbapi_connection.commit()
+
+
+# Count queries scan tables with tens of millions of rows, so results are
+# shared between dashboard polls for a few seconds.
+COUNTS_CACHE_TTL = 5  # seconds
+_counts_cache: dict[str, tuple[float, dict]] = {}
+_counts_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def cached_counts(
+    key: str,
+    compute: Callable[[], Awaitable[dict]],
+    no_cache: bool = False,
+) -> dict:
+    """
+    Return a cached result for key, computing it at most once per TTL.
+
+    Concurrent callers for the same key wait on a lock instead of all running
+    the underlying queries.
+
+    Args:
+        key: Cache key (one per endpoint)
+        compute: Coroutine function producing the value on a miss
+        no_cache: Bypass the cached value and refresh it
+    """
+    if not no_cache:
+        entry = _counts_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+    async with _counts_locks[key]:
+        entry = _counts_cache.get(key)
+        if not no_cache and entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        value = await compute()
+        _counts_cache[key] = (time.monotonic() + COUNTS_CACHE_TTL, value)
+        return value
+
+
+async def count_tables(tables) -> dict:
+    """
+    Get exact row counts for several tables concurrently.
+
+    Each table is counted on its own pooled connection in a worker thread, so
+    the wall time is that of the slowest table rather than the sum.
+
+    Args:
+        tables: Names of the tables to count; must be in ALLOWED_TABLES
+
+    Returns:
+        Dictionary mapping table name to row count
+    """
+    unknown = set(tables) - COUNT_STMTS.keys()
+    if unknown:
+        raise ValueError(f"Cannot count unknown tables: {sorted(unknown)}")
+
+    def count(table: str) -> int:
+        with monitoring_engine.connect() as conn:
+            return conn.execute(COUNT_STMTS[table]).scalar()
+
+    results = await asyncio.gather(*(run_in_threadpool(count, table) for table in tables))
+    return dict(zip(tables, results))
+
 
 @router.get("/import/live-status")
-async def get_live_import_status(db: Session = Depends(get_db)):
+async def get_live_import_status(db: Session = Depends(get_monitoring_db)):
     """
     Get real-time import status with active queries and progress estimates.
+
+    Counts come from mv_import_progress and are fetched together with the
+    active queries in a single query.
     """
     try:
-        # Get current counts
-        tables = {
-            "search_docket": 70000000,
-            "search_opinioncluster": 6000000,
-            "search_opinionscited": 76000000,
-            "search_parenthetical": 6000000,
-            "people_db_court": 3355,
-            "people_db_person": 16191
-        }
+        status = db.execute(LIVE_STATUS_SQL).scalar()
+        counts = status["counts"]
 
         current_counts = {}
-        for table, expected in tables.items():
-            result = db.execute(text(f"SELECT COUNT(*) FROM {table}"))
-            current = result.scalar()
+        total_current = 0
+        for table, expected in EXPECTED_COUNTS.items():
+            current = counts.get(table, 0)
+            if table in EXPECTED_LARGE_COUNTS:
+                total_current += current
             current_counts[table] = {
                 "current": current,
                 "expected": expected,
@@ -38,40 +223,17 @@ async def get_live_import_status(db: Session = Depends(get_db)):
                 "status": "completed" if current >= expected else ("importing" if current > 0 else "pending")
             }
 
-        # Get active queries
-        result = db.execute(text("""
-            SELECT
-                pid,
-                query,
-                state,
-                EXTRACT(EPOCH FROM (NOW() - query_start)) as duration_seconds
-            FROM pg_stat_activity
-            WHERE state = 'active'
-            AND query NOT LIKE '%pg_stat_activity%'
-            AND query NOT LIKE '%COUNT%'
-            ORDER BY query_start
-        """))
-
         active_queries = []
-        for row in result:
-            query_text = row[1][:100] if row[1] else ""
-            # Extract table name from INSERT query
-            table_name = None
-            if "INSERT INTO" in query_text:
-                parts = query_text.split("INSERT INTO")[1].split("(")[0].strip()
-                table_name = parts.split()[0].strip('"')
-
+        for row in status["active"]:
             active_queries.append({
-                "pid": row[0],
-                "table": table_name,
-                "query_preview": query_text,
-                "duration_seconds": round(row[3], 1) if row[3] else 0
+                "pid": row["pid"],
+                "table": row["target_table"],
+                "query_preview": row["query_preview"] or "",
+                "duration_seconds": round(row["duration_seconds"], 1) if row["duration_seconds"] else 0
             })
 
         # Calculate overall progress
-        total_current = sum(c["current"] for c in current_counts.values() if c["expected"] > 1000)
-        total_expected = sum(c["expected"] for c in current_counts.values() if c["expected"] > 1000)
-        overall_percentage = round((total_current / total_expected * 100), 2) if total_expected > 0 else 0
+        overall_percentage = round((total_current / TOTAL_EXPECTED_LARGE * 100), 2)
 
         # Determine import status
         if len(active_queries) > 0:
@@ -98,11 +260,11 @@ async def get_live_import_status(db: Session = Depends(get_db)):
             "import_status": import_status,
             "overall_percentage": overall_percentage,
             "total_records": total_current,
-            "expected_total": total_expected,  # Changed from total_expected to expected_total
+            "expected_total": TOTAL_EXPECTED_LARGE,  # Changed from total_expected to expected_total
             "tables": current_counts,
             "active_queries": len(active_queries),
             "query_details": query_details_formatted,
-            "timestamp": db.execute(text("SELECT NOW()")).scalar().isoformat()
+            "timestamp": status["now"]
         }
 
     except Exception as e:
@@ -112,48 +274,46 @@ async def get_live_import_status(db: Session = Depends(get_db)):
         }
 
 
+async def _database_counts(db: Session) -> dict:
+    """Collect row counts and sizes for the main case law tables."""
+    # Query counts for all main tables
+    tables = [
+        "search_docket",
+        "search_opinioncluster",
+        "search_opinionscited",
+        "search_parenthetical"
+    ]
+
+    counts = await count_tables(tables)
+
+    # Get database size
+    result = db.execute(DATABASE_SIZE)
+    db_size = result.scalar()
+
+    # Get table sizes
+    result = db.execute(TABLE_SIZES, {"names": tables})
+    table_sizes = {table: None for table in tables}
+    table_sizes.update({row.relname: row.size for row in result})
+
+    return {
+        "counts": counts,
+        "database_size": db_size,
+        "table_sizes": table_sizes,
+        "total_records": sum(counts.values())
+    }
+
+
 @router.get("/database/counts")
-async def get_database_counts(db: Session = Depends(get_db)):
+async def get_database_counts(
+    db: Session = Depends(get_monitoring_db),
+    no_cache: bool = Query(False, description="Bypass the short-lived counts cache"),
+):
     """
     Get current record counts for all tables.
     Useful for monitoring import progress.
     """
     try:
-        # Query counts for all main tables
-        counts = {}
-
-        tables = [
-            "search_docket",
-            "search_opinioncluster",
-            "search_opinionscited",
-            "search_parenthetical"
-        ]
-
-        for table in tables:
-            result = db.execute(text(f"SELECT COUNT(*) FROM {table}"))
-            count = result.scalar()
-            counts[table] = count
-
-        # Get database size
-        result = db.execute(text("""
-            SELECT pg_size_pretty(pg_database_size(current_database())) as size
-        """))
-        db_size = result.scalar()
-
-        # Get table sizes
-        table_sizes = {}
-        for table in tables:
-            result = db.execute(text(f"""
-                SELECT pg_size_pretty(pg_total_relation_size('{table}')) as size
-            """))
-            table_sizes[table] = result.scalar()
-
-        return {
-            "counts": counts,
-            "database_size": db_size,
-            "table_sizes": table_sizes,
-            "total_records": sum(counts.values())
-        }
+        return await cached_counts("database/counts", lambda: _database_counts(db), no_cache)
 
     except Exception as e:
         return {
@@ -166,52 +326,31 @@ async def get_database_counts(db: Session = Depends(get_db)):
 
 
 @router.get("/database/activity")
-async def get_database_activity(db: Session = Depends(get_db)):
+async def get_database_activity(db: Session = Depends(get_monitoring_db)):
     """
     Get current database activity - active connections and queries.
     """
     try:
         # Get active connections
-        result = db.execute(text("""
-            SELECT
-                count(*) as connection_count,
-                count(*) FILTER (WHERE state = 'active') as active_queries,
-                count(*) FILTER (WHERE state = 'idle') as idle_connections
-            FROM pg_stat_activity
-            WHERE datname = current_database()
-        """))
-
-        row = result.fetchone()
+        stats = db.execute(CONNECTION_STATS).mappings().one()
 
         # Get long-running queries
-        result = db.execute(text("""
-            SELECT
-                pid,
-                query,
-                state,
-                EXTRACT(EPOCH FROM (now() - query_start)) as duration_seconds
-            FROM pg_stat_activity
-            WHERE
-                datname = current_database()
-                AND state = 'active'
-                AND query NOT LIKE '%pg_stat_activity%'
-            ORDER BY query_start
-            LIMIT 10
-        """))
+        rows = db.execute(LONG_QUERIES).mappings().all()
 
         active_queries = []
-        for row_query in result:
+        for row in rows:
+            query = row["query"]
             active_queries.append({
-                "pid": row_query[0],
-                "query": row_query[1][:100] + "..." if len(row_query[1]) > 100 else row_query[1],
-                "state": row_query[2],
-                "duration_seconds": float(row_query[3]) if row_query[3] else 0
+                "pid": row["pid"],
+                "query": query[:100] + "..." if len(query) > 100 else query,
+                "state": row["state"],
+                "duration_seconds": float(row["duration_seconds"]) if row["duration_seconds"] else 0
             })
 
         return {
-            "connection_count": row[0],
-            "active_queries": row[1],
-            "idle_connections": row[2],
+            "connection_count": stats["connection_count"],
+            "active_queries": stats["active_queries"],
+            "idle_connections": stats["idle_connections"],
             "active_query_details": active_queries
         }
 
@@ -226,30 +365,27 @@ async def get_database_activity(db: Session = Depends(get_db)):
 
 
 @router.get("/import/progress")
-async def get_import_progress(db: Session = Depends(get_db)):
+async def get_import_progress(
+    db: Session = Depends(get_monitoring_db),
+    no_cache: bool = Query(False, description="Bypass the short-lived counts cache"),
+):
     """
     Get import progress by comparing current counts to expected totals.
     """
-    # Expected final counts (from your local database)
-    expected_counts = {
-        "search_docket": 70000000,  # ~70M
-        "search_opinioncluster": 6000000,  # ~6M
-        "search_opinionscited": 76000000,  # ~76M
-        "search_parenthetical": 6000000  # ~6M
-    }
-
     try:
         # Get current counts
-        current_counts = {}
+        counts = await cached_counts(
+            "import/progress", lambda: run_in_threadpool(get_import_progress_counts, db), no_cache
+        )
         progress = {}
+        total_current = 0
 
-        for table, expected in expected_counts.items():
-            result = db.execute(text(f"SELECT COUNT(*) FROM {table}"))
-            current = result.scalar()
-            current_counts[table] = current
+        for table, expected in EXPECTED_LARGE_COUNTS.items():
+            current = counts.get(table, 0)
+            total_current += current
 
             # Calculate progress percentage
-            pct = (current / expected * 100) if expected > 0 else 0
+            pct = current / expected * 100
             progress[table] = {
                 "current": current,
                 "expected": expected,
@@ -259,17 +395,15 @@ async def get_import_progress(db: Session = Depends(get_db)):
             }
 
         # Calculate overall progress
-        total_current = sum(current_counts.values())
-        total_expected = sum(expected_counts.values())
-        overall_percentage = (total_current / total_expected * 100) if total_expected > 0 else 0
+        overall_percentage = total_current / TOTAL_EXPECTED_LARGE * 100
 
         return {
             "tables": progress,
             "overall": {
                 "current": total_current,
-                "expected": total_expected,
+                "expected": TOTAL_EXPECTED_LARGE,
                 "percentage": round(overall_percentage, 2),
-                "remaining": total_expected - total_current
+                "remaining": TOTAL_EXPECTED_LARGE - total_current
             }
         }
 
@@ -4,13 +4,19 @@ Opinion Cluster API Routes
 Endpoints for searching and browsing opinion clusters.
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, and_, select
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, and_, select, text
 from typing import Optional, List
+from datetime import date
 import logging
 
+import orjson
+
 from app.api.deps import get_db
+from app.api.responses import json_payload_response
+from app.core.cache import OPINIONS_NAMESPACE, build_key, get_cached, set_cached
 from app.models import OpinionCluster, Docket, Citation
+from app.services.row_counts import EXACT_COUNT_THRESHOLD, estimate_rows
 from app.schemas.opinion import (
     OpinionClusterListItem,
     OpinionClusterDetail,
@@ -21,20 +27,56 @@ from app.schemas.opinion import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Exactly the columns OpinionClusterListItem needs, so list queries return
+# plain rows instead of hydrating full OpinionCluster instances
+LIST_ITEM_FIELDS = tuple(OpinionClusterListItem.model_fields)
+LIST_ITEM_COLUMNS = tuple(getattr(OpinionCluster, name) for name in LIST_ITEM_FIELDS)
+
+# Sortable columns for list_opinions; each is backed by a B-tree index.
+# Anything else falls back to date_filed.
+ALLOWED_SORTS = {
+    "date_filed": OpinionCluster.date_filed,
+    "citation_count": OpinionCluster.citation_count,
+    "id": OpinionCluster.id,
+}
+
+# Pre-aggregated stats, refreshed by app.services.opinion_stats after imports
+STATUS_COUNTS = text("""
+    SELECT precedential_status, count
+    FROM mv_opinion_status
+    ORDER BY count DESC
+""")
+
+TIMELINE_COUNTS = text("""
+    SELECT year, SUM(count)::bigint AS count
+    FROM mv_opinion_timeline
+    WHERE (CAST(:court_id AS text) IS NULL OR court_id = :court_id)
+    AND (CAST(:start_year AS int) IS NULL OR year >= :start_year)
+    AND (CAST(:end_year AS int) IS NULL OR year <= :end_year)
+    GROUP BY year
+    ORDER BY year
+""")
+
+# Stats only change when an import runs (which invalidates OPINIONS_NAMESPACE),
+# so they can be cached far longer than browse results
+STATUS_CACHE_TTL = 3600  # seconds
+TIMELINE_CACHE_TTL = 3600
+TOP_CITED_CACHE_TTL = 1800
+
 
 @router.get("/", response_model=OpinionSearchResponse)
 async def list_opinions(
     db: Session = Depends(get_db),
-    q: Optional[str] = Query(None, description="Search query"),
+    q: Optional[str] = Query(None, description="Search query (web search syntax: quotes, OR, -term)"),
     court_id: Optional[str] = Query(None, description="Filter by court ID (via docket)"),
-    date_filed_after: Optional[str] = Query(None, description="Filter by date filed (YYYY-MM-DD)"),
-    date_filed_before: Optional[str] = Query(None, description="Filter by date filed (YYYY-MM-DD)"),
+    date_filed_after: Optional[date] = Query(None, description="Filter by date filed (YYYY-MM-DD)"),
+    date_filed_before: Optional[date] = Query(None, description="Filter by date filed (YYYY-MM-DD)"),
     precedential_status: Optional[str] = Query(None, description="Filter by precedential status"),
     citation_count_min: Optional[int] = Query(None, description="Minimum citation count"),
     blocked: Optional[bool] = Query(None, description="Filter by blocked status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    sort_by: str = Query("date_filed", description="Sort field"),
+    sort_by: str = Query("date_filed", description="Sort field: date_filed, citation_count, id, or 'relevance' when searching"),
     sort_order: str = Query("desc", description="Sort order: asc or desc"),
 ):
     """
@@ -47,23 +89,27 @@ async def list_opinions(
     - Pagination
     """
     try:
-        # Build base query with join to docket for court filtering
-        query = db.query(OpinionCluster)
+        # Build base query over the list item columns only. No ORM instances are
+        # created, so relationships can never be lazy-loaded per row.
+        query = db.query(*LIST_ITEM_COLUMNS)
 
         # Apply filters
+        filtered = any(
+            value is not None
+            for value in (q, court_id, date_filed_after, date_filed_before,
+                          precedential_status, citation_count_min, blocked)
+        )
+        ts_query = None
         if q:
-            # Full-text search on case name and judges
-            search_filter = or_(
-                OpinionCluster.case_name.ilike(f"%{q}%"),
-                OpinionCluster.case_name_short.ilike(f"%{q}%"),
-                OpinionCluster.case_name_full.ilike(f"%{q}%"),
-                OpinionCluster.judges.ilike(f"%{q}%")
-            )
-            query = query.filter(search_filter)
+            # Full-text search on case names and judges via the GIN-indexed
+            # search_vector column
+            ts_query = func.websearch_to_tsquery("english", q)
+            query = query.filter(OpinionCluster.search_vector.op("@@")(ts_query))
 
         if court_id:
-            # Join with docket to filter by court
-            query = query.join(Docket).filter(Docket.court_id == court_id)
+            # Semi-join: the court's dockets drive the lookup of their opinions
+            court_dockets = select(Docket.id).where(Docket.court_id == court_id)
+            query = query.filter(OpinionCluster.docket_id.in_(court_dockets))
 
         if date_filed_after:
             query = query.filter(OpinionCluster.date_filed >= date_filed_after)
@@ -80,40 +126,68 @@ async def list_opinions(
         if blocked is not None:
             query = query.filter(OpinionCluster.blocked == blocked)
 
-        # Get total count before pagination
-        total = query.count()
+        # Estimate the total. When the filtered set is small enough to count,
+        # count it with a window function in the page query itself rather than
+        # a separate COUNT(*) round trip.
+        estimate = estimate_rows(
+            db, query, unfiltered_table=None if filtered else OpinionCluster.__tablename__
+        )
+        count_exactly = estimate < EXACT_COUNT_THRESHOLD
+        unpaged_query = query
+        if count_exactly:
+            query = query.add_columns(func.count().over().label("total"))
 
         # Apply sorting
-        sort_column = getattr(OpinionCluster, sort_by, OpinionCluster.date_filed)
+        if sort_by == "relevance" and ts_query is not None:
+            sort_column = func.ts_rank_cd(OpinionCluster.search_vector, ts_query)
+        else:
+            sort_column = ALLOWED_SORTS.get(sort_by, OpinionCluster.date_filed)
+        # id breaks ties so offset pages are stable (matches idx_opinion_date_filed_id)
         if sort_order.lower() == "desc":
-            query = query.order_by(sort_column.desc())
+            query = query.order_by(sort_column.desc(), OpinionCluster.id.desc())
         else:
-            query = query.order_by(sort_column.asc())
+            query = query.order_by(sort_column.asc(), OpinionCluster.id.asc())
 
-        # Apply pagination
+        # Apply pagination, fetching one extra row to detect a next page
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        query = query.offset(offset).limit(page_size + 1)
 
         # Execute query
         opinions = query.all()
+        has_next = len(opinions) > page_size
+        opinions = opinions[:page_size]
+
+        if not count_exactly:
+            total, total_is_estimate = estimate, True
+        elif opinions:
+            total, total_is_estimate = opinions[0].total, False
+        else:
+            # Page past the end: no row carries the window count
+            total, total_is_estimate = unpaged_query.count(), False
 
-        # Convert to response models
-        items = [OpinionClusterListItem.model_validate(op) for op in opinions]
+        # Convert to response models; rows come straight from typed columns,
+        # so validation is skipped. zip() drops the trailing total column.
+        items = [
+            OpinionClusterListItem.model_construct(**dict(zip(LIST_ITEM_FIELDS, op)))
+            for op in opinions
+        ]
 
         # Calculate pagination metadata
         total_pages = (total + page_size - 1) // page_size
-        has_next = page < total_pages
         has_prev = page > 1
 
-        return OpinionSearchResponse(
+        # Serialize once here; returning the model would make FastAPI dump it,
+        # re-validate every item against response_model, then serialize again
+        return json_payload_response(OpinionSearchResponse(
             items=items,
             total=total,
+            total_is_estimate=total_is_estimate,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
             has_next=has_next,
             has_prev=has_prev,
-        )
+        ).model_dump_json())
 
     except Exception as e:
         logger.error(f"Error listing opinions: {str(e)}")
@@ -158,11 +232,17 @@ async def get_opinion_docket(
         opinion_id: The ID of the opinion cluster
     """
     try:
-        opinion = db.query(OpinionCluster).filter(OpinionCluster.id == opinion_id).first()
+        # Join the docket in so this is a single query
+        opinion = (
+            db.query(OpinionCluster)
+            .options(joinedload(OpinionCluster.docket))
+            .filter(OpinionCluster.id == opinion_id)
+            .first()
+        )
         if not opinion:
             raise HTTPException(status_code=404, detail=f"Opinion {opinion_id} not found")
 
-        docket = db.query(Docket).filter(Docket.id == opinion.docket_id).first()
+        docket = opinion.docket
         if not docket:
             raise HTTPException(status_code=404, detail=f"Docket not found for opinion {opinion_id}")
 
@@ -194,6 +274,15 @@ async def get_top_cited_opinions(
     Returns opinions ordered by citation count.
     """
     try:
+        cache_key = await build_key(OPINIONS_NAMESPACE, {
+            "endpoint": "stats/top-cited",
+            "court_id": court_id,
+            "limit": limit,
+        })
+        cached = await get_cached(cache_key)
+        if cached:
+            return json_payload_response(cached)
+
         query = db.query(
             OpinionCluster.id,
             OpinionCluster.case_name,
@@ -212,12 +301,12 @@ async def get_top_cited_opinions(
 
         results = query.all()
 
-        return {
+        response = {
             "opinions": [
                 {
                     "id": r.id,
                     "case_name": r.case_name,
-                    "date_filed": str(r.date_filed) if r.date_filed else None,
+                    "date_filed": r.date_filed,
                     "citation_count": r.citation_count,
                     "precedential_status": r.precedential_status,
                     "court_id": r.court_id,
@@ -226,6 +315,11 @@ async def get_top_cited_opinions(
             ],
             "total": len(results)
         }
+        # Serialize once (orjson encodes dates natively) for both the cache
+        # and the response body
+        body = orjson.dumps(response)
+        await set_cached(cache_key, body.decode(), ttl=TOP_CITED_CACHE_TTL)
+        return json_payload_response(body)
 
     except Exception as e:
         logger.error(f"Error getting top cited opinions: {str(e)}")
@@ -240,18 +334,14 @@ async def get_opinions_by_status(
     Get opinion counts grouped by precedential status.
     """
     try:
-        results = db.query(
-            OpinionCluster.precedential_status,
-            func.count(OpinionCluster.id).label('count')
-        ).filter(
-            OpinionCluster.precedential_status.isnot(None)
-        ).group_by(
-            OpinionCluster.precedential_status
-        ).order_by(
-            func.count(OpinionCluster.id).desc()
-        ).all()
+        cache_key = await build_key(OPINIONS_NAMESPACE, {"endpoint": "stats/by-status"})
+        cached = await get_cached(cache_key)
+        if cached:
+            return json_payload_response(cached)
 
-        return {
+        results = db.execute(STATUS_COUNTS).all()
+
+        response = {
             "statuses": [
                 {
                     "status": r.precedential_status,
@@ -260,6 +350,10 @@ async def get_opinions_by_status(
                 for r in results
             ]
         }
+        # Serialize once for both the cache and the response body
+        body = orjson.dumps(response)
+        await set_cached(cache_key, body.decode(), ttl=STATUS_CACHE_TTL)
+        return json_payload_response(body)
 
     except Exception as e:
         logger.error(f"Error getting opinions by status: {str(e)}")
@@ -279,28 +373,23 @@ async def get_opinion_timeline(
     Returns aggregated counts by year.
     """
     try:
-        # Build query to aggregate by year
-        query = db.query(
-            func.extract('year', OpinionCluster.date_filed).label('year'),
-            func.count(OpinionCluster.id).label('count')
-        ).filter(OpinionCluster.date_filed.isnot(None))
-
-        # Apply filters
-        if court_id:
-            query = query.join(Docket).filter(Docket.court_id == court_id)
-
-        if start_year:
-            query = query.filter(func.extract('year', OpinionCluster.date_filed) >= start_year)
-
-        if end_year:
-            query = query.filter(func.extract('year', OpinionCluster.date_filed) <= end_year)
-
-        # Group and order
-        query = query.group_by('year').order_by('year')
-
-        results = query.all()
-
-        return {
+        cache_key = await build_key(OPINIONS_NAMESPACE, {
+            "endpoint": "stats/timeline",
+            "court_id": court_id,
+            "start_year": start_year,
+            "end_year": end_year,
+        })
+        cached = await get_cached(cache_key)
+        if cached:
+            return json_payload_response(cached)
+
+        results = db.execute(TIMELINE_COUNTS, {
+            "court_id": court_id or None,
+            "start_year": start_year or None,
+            "end_year": end_year or None,
+        }).all()
+
+        response = {
             "timeline": [
                 {
                     "year": int(r.year),
@@ -309,6 +398,10 @@ async def get_opinion_timeline(
                 for r in results
             ]
         }
+        # Serialize once for both the cache and the response body
+        body = orjson.dumps(response)
+        await set_cached(cache_key, body.decode(), ttl=TIMELINE_CACHE_TTL)
+        return json_payload_response(body)
 
     except Exception as e:
         logger.error(f"Error getting opinion timeline: {str(e)}")
@@ -4,15 +4,24 @@ Simple Download API Routes
 Simple endpoint to download specific CSV files from CourtListener S3.
 """
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pathlib import Path
 import logging
-from app.services.s3_downloader import CourtListenerDownloader
+import os
+import time
+from celery.result import AsyncResult
+from app.celery_app import celery_app
 from app.core.config import settings
+from app.tasks.download_tasks import download_file_task
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-downloader = CourtListenerDownloader()
+
+# Files grow while downloads are in progress, so the listing is cached for a
+# short time rather than keyed on the directory mtime
+LIST_FILES_CACHE_TTL = 30  # seconds
+_files_cache: dict = {"expires": 0.0, "files": []}
 
 
 @router.post("/download-file")
@@ -21,14 +30,16 @@ async def download_single_file(table_name: str, dataset_date: str = "2025-10-31"
     Download a single CSV file from CourtListener S3 to Railway volume.
 
     This endpoint downloads files directly from S3, which is much faster than
-    uploading from a local machine.
+    uploading from a local machine. The download runs as a Celery task; poll
+    GET /download-file/status/{task_id} for the result.
 
     Args:
         table_name: Name of the table (e.g., "search_docket", "search_opinioncluster")
         dataset_date: Date string (default "2025-10-31")
 
     Returns:
-        Dictionary with download status and file information
+        Dictionary with the queued task ID, or file information if the file
+        is already on the volume
     """
     try:
         # Mapping of table names to S3 file names
@@ -65,32 +76,79 @@ async def download_single_file(table_name: str, dataset_date: str = "2025-10-31"
                 "message": f"File already exists: {target_path.name}"
             }
 
-        logger.info(f"[DOWNLOAD] Starting download: {s3_file} → {target_path}")
-
-        # Download from S3
-        downloaded_path = downloader.download_file(
-            key=f"bulk-data/{s3_file}",
-            target_path=target_path
-        )
-
-        file_size_gb = downloaded_path.stat().st_size / (1024**3)
-        logger.info(f"[DOWNLOAD] Complete: {downloaded_path.name} ({file_size_gb:.2f} GB)")
+        # Download from S3 in a worker so the API process is not tied up
+        task = download_file_task.delay(f"bulk-data/{s3_file}", target_path.name)
+        logger.info(f"[DOWNLOAD] Queued download: {s3_file} → {target_path} (task {task.id})")
 
         return {
-            "status": "success",
+            "status": "queued",
+            "task_id": task.id,
             "table_name": table_name,
             "dataset_date": dataset_date,
-            "filename": downloaded_path.name,
-            "path": str(downloaded_path),
-            "size_gb": round(file_size_gb, 2),
-            "message": f"Downloaded successfully: {downloaded_path.name}"
+            "filename": target_path.name,
+            "path": str(target_path),
+            "message": f"Download queued: {target_path.name}"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"[DOWNLOAD] Error downloading {table_name}: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/download-file/status/{task_id}")
+async def get_download_file_status(task_id: str):
+    """
+    Get the status of a download queued by POST /download-file.
+
+    Args:
+        task_id: Task ID returned when the download was queued
+
+    Returns:
+        Dictionary with task state and, once finished, the result or error
+    """
+    task = AsyncResult(task_id, app=celery_app)
+
+    response = {"task_id": task_id, "state": task.state}
+    if task.state == "SUCCESS":
+        result = task.result or {}
+        response["file"] = result.get("file")
+        response["size_gb"] = round(result.get("size", 0) / (1024**3), 2)
+    elif task.state == "FAILURE":
+        response["error"] = str(task.info)
+
+    return response
+
+
+def _scan_csv_files(data_dir: Path) -> list:
+    """
+    List CSV files in data_dir with their sizes, sorted by name.
+
+    Uses os.scandir so sizes come from the directory entries; blocking, so
+    call it via run_in_threadpool.
+    """
+    now = time.monotonic()
+    if _files_cache["expires"] > now:
+        return _files_cache["files"]
+
+    csv_files = []
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".csv") and entry.is_file():
+                csv_files.append({
+                    "filename": entry.name,
+                    "path": entry.path,
+                    "size_gb": round(entry.stat().st_size / (1024**3), 2)
+                })
+
+    csv_files.sort(key=lambda f: f["filename"])
+
+    _files_cache["expires"] = now + LIST_FILES_CACHE_TTL
+    _files_cache["files"] = csv_files
+    return csv_files
+
+
 @router.get("/list-files")
 async def list_downloaded_files():
     """
@@ -109,14 +167,7 @@ async def list_downloaded_files():
                 "files": []
             }
 
-        csv_files = []
-        for csv_file in sorted(data_dir.glob("*.csv")):
-            file_size_gb = csv_file.stat().st_size / (1024**3)
-            csv_files.append({
-                "filename": csv_file.name,
-                "path": str(csv_file),
-                "size_gb": round(file_size_gb, 2)
-            })
+        csv_files = await run_in_threadpool(_scan_csv_files, data_dir)
 
         return {
             "status": "success",
@@ -0,0 +1,76 @@
+"""
+Upload Helpers
+
+Shared helpers for routes that write uploaded files to disk.
+"""
+import os
+import re
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional
+
+from fastapi import HTTPException
+
+# Read buffer reused for the whole upload (1MB)
+UPLOAD_BUFFER_SIZE = 1 << 20
+
+# Uploaded files may only use plain filename characters
+_SAFE_FILENAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+def safe_upload_path(directory: Path, filename: Optional[str]) -> Path:
+    """
+    Resolve a client-supplied filename to a path inside directory.
+
+    Args:
+        directory: Directory the file must be written to
+        filename: Filename as sent by the client
+
+    Returns:
+        Absolute target path
+
+    Raises:
+        HTTPException: 400 if the filename is empty, has disallowed characters,
+            or would resolve outside directory
+    """
+    safe_name = os.path.basename(filename or "")
+    if not _SAFE_FILENAME.match(safe_name):
+        raise HTTPException(status_code=400, detail=f"Invalid filename: {filename!r}")
+
+    base = directory.resolve()
+    target = (base / safe_name).resolve()
+    if not target.is_relative_to(base):
+        raise HTTPException(status_code=400, detail=f"Invalid filename: {filename!r}")
+
+    return target
+
+
+def copy_upload(
+    source: BinaryIO,
+    target_path: Path,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Copy an uploaded file object to disk through a single preallocated buffer.
+
+    Blocking; call via run_in_threadpool from async routes.
+
+    Args:
+        source: Binary file object supporting readinto (UploadFile.file)
+        target_path: Destination path
+        on_progress: Optional callback receiving total bytes written after each read
+
+    Returns:
+        Number of bytes written
+    """
+    buffer = bytearray(UPLOAD_BUFFER_SIZE)
+    view = memoryview(buffer)
+    bytes_written = 0
+
+    with open(target_path, "wb") as out:
+        while n := source.readinto(view):
+            out.write(view[:n])
+            bytes_written += n
+            if on_progress:
+                on_progress(bytes_written)
+
+    return bytes_written
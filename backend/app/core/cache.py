@@ -0,0 +1,96 @@
+"""
+Response Cache
+
+Short-lived Redis cache for read-heavy API responses.
+
+Browsing data only changes when an import runs, so cached responses use a
+short TTL and every namespace carries a version counter. Import tasks bump
+the counter, which orphans all existing keys for that namespace at once.
+Redis being unavailable never fails a request - the cache is simply skipped.
+"""
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Namespaces for cached API responses
+DOCKETS_NAMESPACE = "dockets"
+OPINIONS_NAMESPACE = "opinions"
+
+_async_client: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Return the shared asyncio Redis client, creating it on first use."""
+    global _async_client
+    if _async_client is None:
+        _async_client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _async_client
+
+
+def _version_key(namespace: str) -> str:
+    return f"{namespace}:version"
+
+
+async def build_key(namespace: str, params: Dict[str, Any]) -> Optional[str]:
+    """
+    Build a cache key for a request from its namespace and parameters.
+
+    Args:
+        namespace: Cache namespace (e.g. DOCKETS_NAMESPACE)
+        params: Request parameters that fully determine the response
+
+    Returns:
+        Cache key, or None if Redis is unreachable
+    """
+    try:
+        version = await get_redis().get(_version_key(namespace)) or "0"
+    except redis.RedisError as e:
+        logger.warning(f"Response cache unavailable: {e}")
+        return None
+
+    payload = json.dumps(params, sort_keys=True, default=str).encode()
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return f"{namespace}:{version}:{digest}"
+
+
+async def get_cached(key: Optional[str]) -> Optional[str]:
+    """Return the cached payload for key, or None on a miss."""
+    if key is None:
+        return None
+    try:
+        return await get_redis().get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Response cache read failed: {e}")
+        return None
+
+
+async def set_cached(key: Optional[str], value: str, ttl: Optional[int] = None) -> None:
+    """Store a payload under key with a TTL (defaults to settings.CACHE_TTL_SECONDS)."""
+    if key is None:
+        return
+    try:
+        await get_redis().set(key, value, ex=ttl or settings.CACHE_TTL_SECONDS)
+    except redis.RedisError as e:
+        logger.warning(f"Response cache write failed: {e}")
+
+
+def invalidate_namespace(namespace: str) -> None:
+    """
+    Invalidate every cached response in a namespace.
+
+    Synchronous so it can be called from Celery tasks and import scripts.
+    """
+    try:
+        client = redis.Redis.from_url(settings.REDIS_URL)
+        client.incr(_version_key(namespace))
+        client.close()
+    except redis.RedisError as e:
+        logger.warning(f"Failed to invalidate cache namespace {namespace}: {e}")
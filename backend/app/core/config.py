@@ -3,8 +3,10 @@ Application Configuration
 
 Loads environment variables and provides application settings.
 """
+from functools import lru_cache
+from pydantic import PrivateAttr, model_validator
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Tuple
 
 
 class Settings(BaseSettings):
@@ -15,6 +17,7 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_TTL_SECONDS: int = 60  # TTL for cached API responses
 
     # Environment
     ENVIRONMENT: str = "development"
@@ -35,16 +38,32 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
 
+    # Parsed CORS origins, computed once after validation
+    _cors_origins: Tuple[str, ...] = PrivateAttr(default=())
+
     class Config:
         env_file = ".env"
         case_sensitive = True
 
-    def get_cors_origins(self) -> List[str]:
+    @model_validator(mode="after")
+    def parse_cors_origins(self) -> "Settings":
         """Parse CORS origins from comma-separated string"""
         if self.ALLOWED_ORIGINS:
-            return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
-        return self.CORS_ORIGINS
+            self._cors_origins = tuple(origin.strip() for origin in self.ALLOWED_ORIGINS.split(","))
+        else:
+            self._cors_origins = tuple(self.CORS_ORIGINS)
+        return self
+
+    def get_cors_origins(self) -> List[str]:
+        """Return the CORS origins parsed at startup"""
+        return list(self._cors_origins)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment and .env once."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
 
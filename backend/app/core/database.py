@@ -9,16 +9,43 @@ from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
 # Create SQLAlchemy engine
+# pool_recycle retires connections before the Railway proxy drops them as idle.
+# query_cache_size is raised from the default 500 because the list endpoints
+# build a distinct statement shape per filter/sort combination; each shape is
+# compiled once and then served from this cache.
+# values_plus_batch sends executemany calls that insertmanyvalues does not cover
+# (text() INSERTs, UPDATEs, DELETEs) through psycopg2's execute_batch instead
+# of one round trip per row.
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_recycle=1800,
+    pool_size=20,
+    max_overflow=10,
+    query_cache_size=2000,
+    executemany_mode="values_plus_batch",
+    executemany_batch_page_size=500,
+    insertmanyvalues_page_size=1000,
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Separate small pool for the monitoring endpoints. Its connections carry a
+# distinct application_name so pg_stat_activity queries can exclude them.
+MONITORING_APPLICATION_NAME = "monitoring"
+
+monitoring_engine = create_engine(
+    settings.DATABASE_URL,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_size=5,
+    max_overflow=5,
+    connect_args={"application_name": MONITORING_APPLICATION_NAME},
+)
+
+MonitoringSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=monitoring_engine)
+
 # Base class for models
 Base = declarative_base()
 
@@ -38,3 +65,11 @@ def get_db():
     finally:
         db.close()
 
+
+def get_monitoring_db():
+    """Dependency function for monitoring routes; yields a session on monitoring_engine."""
+    db = MonitoringSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -3,9 +3,13 @@ CourtListener Database Browser - FastAPI Application Entry Point
 
 This module initializes the FastAPI application and includes all API routes.
 """
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
+from app.services.import_progress import refresh_import_progress_loop
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -14,6 +18,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -25,6 +30,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON list payloads; small responses are not worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Background refresh of the import progress materialized view
+@app.on_event("startup")
+async def start_import_progress_refresh():
+    app.state.import_progress_task = asyncio.create_task(refresh_import_progress_loop())
+
+
+@app.on_event("shutdown")
+async def stop_import_progress_refresh():
+    app.state.import_progress_task.cancel()
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -3,7 +3,7 @@ Citation Model
 
 Maps citations between opinions (who cited whom).
 """
-from sqlalchemy import Column, Integer, Float, ForeignKey
+from sqlalchemy import Column, Integer, Float, ForeignKey, text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -24,7 +24,7 @@ class Citation(Base):
     cited_opinion_id = Column(Integer, nullable=False, index=True)
 
     # Citation metadata
-    depth = Column(Integer, default=1)  # How many times cited
+    depth = Column(Integer, server_default=text("1"))  # How many times cited
     score = Column(Float, nullable=True)  # Citation importance score
 
     def __repr__(self):
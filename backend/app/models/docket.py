@@ -3,7 +3,7 @@ Docket Model
 
 Represents a legal case docket with metadata.
 """
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Text, Boolean, SmallInteger, DateTime
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Text, Boolean, SmallInteger, DateTime, text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -35,10 +35,10 @@ class Docket(Base):
     case_name_short = Column(Text, nullable=True)
     case_name_full = Column(Text, nullable=True)
 
-    # Case details (from migration bc02f0ddd58f)
-    cause = Column(String(2000), nullable=True)
-    nature_of_suit = Column(String(1000), nullable=True)
-    jury_demand = Column(String(500), nullable=True)
+    # Case details (from migration bc02f0ddd58f; free-form columns are text since b700102d1a87)
+    cause = Column(Text, nullable=True)
+    nature_of_suit = Column(Text, nullable=True)
+    jury_demand = Column(Text, nullable=True)
     jurisdiction_type = Column(String(100), nullable=True)
 
     # Dates
@@ -58,10 +58,10 @@ class Docket(Base):
     pacer_case_id = Column(String(100), nullable=True, index=True)
     slug = Column(String(75), nullable=True, index=True)
 
-    # File paths (from migration bc02f0ddd58f)
-    filepath_local = Column(String(1000), nullable=True)
-    filepath_ia = Column(String(1000), nullable=True)
-    filepath_ia_json = Column(String(1000), nullable=True)
+    # File paths (from migration bc02f0ddd58f; text since b700102d1a87)
+    filepath_local = Column(Text, nullable=True)
+    filepath_ia = Column(Text, nullable=True)
+    filepath_ia_json = Column(Text, nullable=True)
 
     # String representations (from migration bc02f0ddd58f)
     assigned_to_str = Column(Text, nullable=True)
@@ -96,15 +96,23 @@ class Docket(Base):
     idb_data_id = Column(Integer, nullable=True)
     docket_number_raw = Column(String, nullable=True)
 
-    # Status
-    blocked = Column(Boolean, default=False, index=True)
+    # Status (database default - migration a0f90267ca4d)
+    blocked = Column(Boolean, server_default=text("false"))  # indexed by idx_docket_blocked_date
 
     # Relationships
-    court = relationship("Court", foreign_keys=[court_id], back_populates="dockets")
-    assigned_to = relationship("Person", foreign_keys=[assigned_to_id])
-    referred_to = relationship("Person", foreign_keys=[referred_to_id])
-    appeal_from = relationship("Court", foreign_keys=[appeal_from_id])
-    opinion_clusters = relationship("OpinionCluster", back_populates="docket", cascade="all, delete-orphan")
+    # None of these are read when serializing dockets, so lazy loads raise
+    # instead of silently issuing one SELECT per docket. Load them explicitly
+    # with joinedload()/selectinload() where needed.
+    court = relationship("Court", foreign_keys=[court_id], back_populates="dockets", lazy="raise")
+    assigned_to = relationship("Person", foreign_keys=[assigned_to_id], lazy="raise")
+    referred_to = relationship("Person", foreign_keys=[referred_to_id], lazy="raise")
+    appeal_from = relationship("Court", foreign_keys=[appeal_from_id], lazy="raise")
+    # passive_deletes: the database deletes the clusters (ON DELETE CASCADE),
+    # so deleting a docket never loads them
+    opinion_clusters = relationship(
+        "OpinionCluster", back_populates="docket", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise"
+    )
 
     def __repr__(self):
         return f"<Docket(id={self.id}, docket_number={self.docket_number}, case_name={self.case_name})>"
@@ -19,7 +19,7 @@ class Education(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # Foreign keys
-    person_id = Column(Integer, ForeignKey("people_db_person.id"), nullable=False, index=True)
+    person_id = Column(Integer, ForeignKey("people_db_person.id", ondelete="CASCADE"), nullable=False, index=True)
     school_id = Column(Integer, ForeignKey("people_db_school.id"), nullable=False, index=True)
     
     # Education details
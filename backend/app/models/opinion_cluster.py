@@ -3,7 +3,8 @@ Opinion Cluster Model
 
 Groups related opinions together (majority, dissent, concurrence).
 """
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Text, Boolean, SmallInteger
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Text, Boolean, SmallInteger, Computed, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -20,7 +21,7 @@ class OpinionCluster(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Foreign keys
-    docket_id = Column(Integer, ForeignKey("search_docket.id"), nullable=False, index=True)
+    docket_id = Column(Integer, ForeignKey("search_docket.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Case information
     case_name = Column(Text, nullable=True)
@@ -28,7 +29,7 @@ class OpinionCluster(Base):
     case_name_full = Column(Text, nullable=True)
 
     # Dates
-    date_filed = Column(Date, nullable=True, index=True)
+    date_filed = Column(Date, nullable=True)  # indexed by idx_opinion_date_filed_id
     date_argued = Column(Date, nullable=True)
     date_reargued = Column(Date, nullable=True)
     date_reargument_denied = Column(Date, nullable=True)
@@ -61,10 +62,10 @@ class OpinionCluster(Base):
     scdb_votes_majority = Column(Integer, nullable=True)
     scdb_votes_minority = Column(Integer, nullable=True)
 
-    # Status
+    # Status (database defaults - migration a0f90267ca4d)
     precedential_status = Column(String(50), nullable=True, index=True)
-    blocked = Column(Boolean, default=False, index=True)
-    citation_count = Column(Integer, default=0, index=True)
+    blocked = Column(Boolean, server_default=text("false"))  # partial index idx_opinion_blocked_date
+    citation_count = Column(Integer, server_default=text("0"), index=True)
 
     # Slugs and URLs
     slug = Column(String(75), nullable=True, index=True)
@@ -73,8 +74,24 @@ class OpinionCluster(Base):
     filepath_json_harvard = Column(Text, nullable=True)
     filepath_pdf_harvard = Column(Text, nullable=True)
 
+    # Full-text search (generated column, GIN indexed - migration 09d047634f43)
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', "
+            "coalesce(case_name, '') || ' ' || "
+            "coalesce(case_name_short, '') || ' ' || "
+            "coalesce(case_name_full, '') || ' ' || "
+            "coalesce(judges, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+    )
+
     # Relationships
-    docket = relationship("Docket", back_populates="opinion_clusters")
+    # Loaded on access; routes that need the docket joinedload it explicitly
+    # so cluster queries do not drag in the wide docket row by default
+    docket = relationship("Docket", back_populates="opinion_clusters", lazy="select")
     # Note: Opinion model not implemented (Option 1: metadata only)
 
     def __repr__(self):
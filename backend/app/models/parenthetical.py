@@ -3,7 +3,7 @@ Parenthetical Model
 
 Represents short summaries of opinions written by courts.
 """
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, BigInteger
+from sqlalchemy import Column, Integer, String, REAL, ForeignKey, Text, BigInteger
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -19,16 +19,18 @@ class Parenthetical(Base):
 
     id = Column(Integer, primary_key=True, index=True)
 
-    # Foreign keys - references opinions table
-    described_opinion_id = Column(Integer, nullable=False, index=True)  # The opinion being described
+    # Foreign keys - references opinions table (not imported, so no FK constraint)
+    # described_opinion_id is indexed together with score - migration 255fc5b3a5f3
+    described_opinion_id = Column(Integer, nullable=False)  # The opinion being described
     describing_opinion_id = Column(Integer, nullable=False, index=True)  # The opinion doing the describing
 
     # Parenthetical content
     text = Column(Text, nullable=False)  # The actual parenthetical text
 
     # Metadata
-    score = Column(Float, nullable=True)  # Relevance/importance score
-    group_id = Column(BigInteger, nullable=True, index=True)  # Groups related parentheticals
+    # (group_id, score) indexed together - migration 07a3d843cacb
+    score = Column(REAL, nullable=True)  # Relevance/importance score
+    group_id = Column(BigInteger, nullable=True)  # Groups related parentheticals
 
     def __repr__(self):
         return f"<Parenthetical(id={self.id}, described={self.described_opinion_id}, text={self.text[:50]}...)>"
@@ -3,7 +3,7 @@ Person Model
 
 Represents a person (judge or legal professional) in the database.
 """
-from sqlalchemy import Column, Integer, String, Date, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Computed, Integer, String, Date, Boolean, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -23,6 +23,20 @@ class Person(Base):
     name_middle = Column(String(50), nullable=True)
     name_last = Column(String(50), nullable=True, index=True)
     name_suffix = Column(String(5), nullable=True)
+
+    # Full name (generated column, trigram GIN indexed - migration 134b62637bc2)
+    name_full = Column(
+        Text,
+        Computed(
+            "ltrim("
+            "coalesce(name_first, '') || "
+            "coalesce(' ' || name_middle, '') || "
+            "coalesce(' ' || name_last, '') || "
+            "coalesce(' ' || name_suffix, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+    )
     
     # Dates
     date_dob = Column(Date, nullable=True, index=True)
@@ -35,22 +49,18 @@ class Person(Base):
     is_alias_of_id = Column(Integer, ForeignKey("people_db_person.id"), nullable=True)
     fjc_id = Column(Integer, nullable=True, index=True)  # Federal Judicial Center ID
     
-    # Relationships
-    positions = relationship("Position", foreign_keys="Position.person_id", back_populates="person", cascade="all, delete-orphan")
-    educations = relationship("Education", back_populates="person", cascade="all, delete-orphan")
-    political_affiliations = relationship("PoliticalAffiliation", back_populates="person", cascade="all, delete-orphan")
-    races = relationship("Race", back_populates="person", cascade="all, delete-orphan")
-    sources = relationship("Source", back_populates="person", cascade="all, delete-orphan")
+    # Relationships (small per-person collections, loaded with one
+    # WHERE person_id IN (...) query each for a whole batch of people;
+    # deletes cascade in the database via ON DELETE CASCADE)
+    positions = relationship("Position", foreign_keys="Position.person_id", back_populates="person", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
+    educations = relationship("Education", back_populates="person", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
+    political_affiliations = relationship("PoliticalAffiliation", back_populates="person", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
+    races = relationship("Race", back_populates="person", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
+    sources = relationship("Source", back_populates="person", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
     
     # Self-referential relationship for aliases
     is_alias_of = relationship("Person", remote_side=[id], backref="aliases")
     
     def __repr__(self):
         return f"<Person(id={self.id}, name='{self.name_first} {self.name_last}')>"
-    
-    @property
-    def name_full(self):
-        """Construct full name from components."""
-        parts = [self.name_first, self.name_middle, self.name_last, self.name_suffix]
-        return " ".join(p for p in parts if p)
 
@@ -19,7 +19,7 @@ class PoliticalAffiliation(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # Foreign key
-    person_id = Column(Integer, ForeignKey("people_db_person.id"), nullable=False, index=True)
+    person_id = Column(Integer, ForeignKey("people_db_person.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Affiliation details
     political_party = Column(String(100), nullable=True, index=True)  # e.g., "Democratic", "Republican", "Independent"
@@ -19,7 +19,7 @@ class Position(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # Foreign keys
-    person_id = Column(Integer, ForeignKey("people_db_person.id"), nullable=False, index=True)
+    person_id = Column(Integer, ForeignKey("people_db_person.id", ondelete="CASCADE"), nullable=False, index=True)
     court_id = Column(String(50), ForeignKey("people_db_court.id"), nullable=True, index=True)  # String to match Court.id
     
     # Position details
@@ -19,7 +19,7 @@ class Source(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # Foreign key
-    person_id = Column(Integer, ForeignKey("people_db_person.id"), nullable=False, index=True)
+    person_id = Column(Integer, ForeignKey("people_db_person.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Source information
     url = Column(String(500), nullable=True)
@@ -1,7 +1,7 @@
 """
 Pydantic schemas for Citation API responses and requests
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Optional, List
 
 
@@ -45,6 +45,11 @@ class CitationNetworkEdge(BaseModel):
     depth: Optional[int] = 0
 
 
+# Validate a whole network's nodes/edges in one call instead of one model per row
+CitationNetworkNodeList = TypeAdapter(List[CitationNetworkNode])
+CitationNetworkEdgeList = TypeAdapter(List[CitationNetworkEdge])
+
+
 class CitationNetworkResponse(BaseModel):
     """Schema for citation network graph data"""
     nodes: List[CitationNetworkNode]
@@ -67,9 +72,17 @@ class CitationStatsResponse(BaseModel):
     top_cited_cases: List[CitationListItem] = Field(description="Top cases cited by this opinion")
 
 
+class TopCitedOpinion(BaseModel):
+    """Schema for a most cited opinions list item"""
+    opinion_id: int
+    case_name: Optional[str] = None
+    citation_count: int = 0
+    court_id: Optional[str] = None
+
+
 class TopCitedOpinionsResponse(BaseModel):
     """Schema for most cited opinions"""
-    items: List[dict]  # opinion_id, case_name, citation_count, court_id
+    items: List[TopCitedOpinion]
     total: int
     page: int
     page_size: int
@@ -0,0 +1,10 @@
+"""
+Shared annotated field types for API schemas
+"""
+from typing import Annotated
+
+from pydantic import Field
+
+# Pagination parameters shared by the search request schemas
+PageNumber = Annotated[int, Field(ge=1, description="Page number")]
+PageSize = Annotated[int, Field(ge=1, le=100, description="Items per page")]
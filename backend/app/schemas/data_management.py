@@ -4,9 +4,20 @@ Data Management Schemas
 Pydantic schemas for data download and import operations.
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from typing import Annotated, Optional, List, Dict, Literal, Tuple
 from datetime import datetime
 
+# Closed sets of status values; validated against a static set and listed as
+# enums in the OpenAPI schema
+DownloadState = Literal["pending", "downloading", "completed", "failed"]
+ImportState = Literal["pending", "importing", "completed", "failed"]
+TableImportState = Literal["pending", "importing", "completed"]
+ChunkState = Literal["pending", "processing", "completed", "failed", "skipped"]
+ChunkSummaryState = Literal["not_started", "pending", "in_progress", "processing", "completed", "failed"]
+ChunkedImportState = Literal["completed", "partial", "failed"]
+
+ChunkSize = Annotated[int, Field(ge=10_000, le=10_000_000, description="Number of rows per chunk")]
+
 
 class DatasetInfo(BaseModel):
     """Information about an available dataset."""
@@ -34,11 +45,17 @@ class DownloadRequest(BaseModel):
     include_schema: bool = Field(True, description="Whether to download schema file")
 
 
+class FileState(BaseModel):
+    """Download state of one file within a DownloadStatus."""
+    status: DownloadState
+    exists: bool = False
+
+
 class DownloadStatus(BaseModel):
     """Status of a download operation."""
-    status: str  # 'pending', 'downloading', 'completed', 'failed'
+    status: DownloadState
     date: str
-    files: Dict[str, Dict] = Field(
+    files: Dict[str, FileState] = Field(
         default_factory=dict,
         description="Dictionary mapping file names to their download status"
     )
@@ -51,7 +68,7 @@ class DownloadStatus(BaseModel):
 class FileDownloadStatus(BaseModel):
     """Status of a single file download."""
     filename: str
-    status: str  # 'pending', 'downloading', 'completed', 'failed'
+    status: DownloadState
     bytes_downloaded: int = 0
     total_bytes: Optional[int] = None
     progress: float = Field(0.0, ge=0.0, le=1.0)
@@ -59,7 +76,7 @@ class FileDownloadStatus(BaseModel):
 
 
 class DatabaseStatus(BaseModel):
-    """Current database status."""
+    """Current database status. Counts of 10,000+ rows are planner estimates."""
     # People database
     total_people: int = 0
     total_positions: int = 0
@@ -88,10 +105,10 @@ class ImportRequest(BaseModel):
 
 class ImportStatus(BaseModel):
     """Status of an import operation."""
-    status: str  # 'pending', 'importing', 'completed', 'failed'
+    status: ImportState
     date: str
     current_table: Optional[str] = None
-    tables_completed: List[str] = Field(default_factory=list)
+    tables_completed: Tuple[str, ...] = ()
     tables_total: int = 0
     progress: float = Field(0.0, ge=0.0, le=1.0)
     error: Optional[str] = None
@@ -127,7 +144,7 @@ class TableImportProgress(BaseModel):
     table_name: str
     current_count: int
     expected_count: int
-    status: str  # 'pending', 'importing', 'completed'
+    status: TableImportState
     progress_percent: float = Field(0.0, ge=0.0, le=100.0)
 
 
@@ -143,26 +160,30 @@ class ImportProgressResponse(BaseModel):
 # CSV Chunk Management Schemas
 # ============================================================================
 
-class ChunkRequest(BaseModel):
-    """Request to chunk a CSV file."""
+class ChunkTarget(BaseModel):
+    """Table and dataset a chunk operation applies to; base for chunk requests."""
     table_name: str = Field(..., description="Name of the database table")
     dataset_date: str = Field(..., description="Date string (YYYY-MM-DD) of the dataset")
+
+
+class ChunkRequest(ChunkTarget):
+    """Request to chunk a CSV file."""
     csv_filename: str = Field(..., description="Name of the CSV file to chunk")
-    chunk_size: int = Field(1_000_000, description="Number of rows per chunk", ge=10_000, le=10_000_000)
+    chunk_size: ChunkSize = 1_000_000
 
 
 class ChunkInfo(BaseModel):
     """Information about a single chunk."""
     chunk_number: int
     chunk_filename: str
-    status: str  # 'pending', 'processing', 'completed', 'failed', 'skipped'
+    status: ChunkState
     chunk_row_count: Optional[int] = None
     rows_imported: Optional[int] = None
     rows_skipped: Optional[int] = None
     duration_seconds: Optional[int] = None
     error_message: Optional[str] = None
-    started_at: Optional[str] = None
-    completed_at: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
 
 
 class ChunkListResponse(BaseModel):
@@ -196,13 +217,11 @@ class ChunkProgressSummary(BaseModel):
     imported_rows: int
     skipped_rows: int
     progress_percentage: float = Field(ge=0.0, le=100.0)
-    status: str  # 'not_started', 'pending', 'in_progress', 'processing', 'completed', 'failed'
+    status: ChunkSummaryState
 
 
-class ChunkedImportRequest(BaseModel):
+class ChunkedImportRequest(ChunkTarget):
     """Request to import data using chunks."""
-    table_name: str = Field(..., description="Name of the database table")
-    dataset_date: str = Field(..., description="Date string (YYYY-MM-DD) of the dataset")
     import_method: str = Field("standard", description="Import method: 'standard', 'pandas', or 'copy'")
     resume: bool = Field(True, description="If true, resume from last successful chunk")
     max_retries: int = Field(3, description="Maximum retry attempts per chunk", ge=1, le=10)
@@ -221,18 +240,14 @@ class ChunkedImportResponse(BaseModel):
     total_rows_skipped: int
     import_method: str
     errors: List[Dict] = Field(default_factory=list)
-    status: str  # 'completed', 'partial', 'failed'
+    status: ChunkedImportState
 
 
-class ChunkResetRequest(BaseModel):
+class ChunkResetRequest(ChunkTarget):
     """Request to reset chunk progress."""
-    table_name: str = Field(..., description="Name of the database table")
-    dataset_date: str = Field(..., description="Date string (YYYY-MM-DD) of the dataset")
 
 
-class ChunkDeleteRequest(BaseModel):
+class ChunkDeleteRequest(ChunkTarget):
     """Request to delete chunks."""
-    table_name: str = Field(..., description="Name of the database table")
-    dataset_date: str = Field(..., description="Date string (YYYY-MM-DD) of the dataset")
     delete_files: bool = Field(True, description="If true, also delete chunk files from disk")
 
@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import date, datetime
 
+from app.schemas.common import PageNumber, PageSize
+
 
 class DocketBase(BaseModel):
     """Base schema for Docket"""
@@ -89,8 +91,8 @@ class DocketSearchRequest(BaseModel):
     has_opinions: Optional[bool] = Field(None, description="Only dockets with opinions")
 
     # Pagination
-    page: int = Field(1, ge=1, description="Page number")
-    page_size: int = Field(50, ge=1, le=100, description="Items per page")
+    page: PageNumber = 1
+    page_size: PageSize = 50
 
     # Sorting
     sort_by: str = Field("date_filed", description="Field to sort by")
@@ -100,9 +102,9 @@ class DocketSearchRequest(BaseModel):
 class DocketSearchResponse(BaseModel):
     """Schema for paginated docket search results"""
     items: List[DocketListItem]
-    total: int
+    total: Optional[int] = Field(None, description="Exact total, only set when include_total=true")
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = Field(None, description="Only set when include_total=true")
     has_next: bool
     has_prev: bool
@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import date
 
+from app.schemas.common import PageNumber, PageSize
+
 
 class OpinionClusterBase(BaseModel):
     """Base schema for Opinion Cluster"""
@@ -76,8 +78,8 @@ class OpinionSearchRequest(BaseModel):
     blocked: Optional[bool] = Field(None, description="Filter by blocked status")
 
     # Pagination
-    page: int = Field(1, ge=1, description="Page number")
-    page_size: int = Field(50, ge=1, le=100, description="Items per page")
+    page: PageNumber = 1
+    page_size: PageSize = 50
 
     # Sorting
     sort_by: str = Field("date_filed", description="Field to sort by")
@@ -88,6 +90,7 @@ class OpinionSearchResponse(BaseModel):
     """Schema for paginated opinion search results"""
     items: List[OpinionClusterListItem]
     total: int
+    total_is_estimate: bool = Field(False, description="True when total comes from planner statistics")
     page: int
     page_size: int
     total_pages: int
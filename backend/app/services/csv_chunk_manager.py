@@ -5,10 +5,13 @@ Handles chunking of large CSV files and tracking import progress.
 Enables safe, resumable imports of massive datasets.
 """
 import csv
+import os
 import sys
 import logging
+from itertools import chain, count, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -16,9 +19,14 @@ from sqlalchemy import text
 from app.core.config import settings
 from app.models.csv_chunk_progress import CSVChunkProgress
 from app.services.data_importer import DataImporter
+from app.services.post_import import finish_import
 
 logger = logging.getLogger(__name__)
 
+# Read buffer for source CSVs (8MB): multi-GB dumps are read front to back,
+# so fewer, larger reads beat the 8KB default
+CSV_READ_BUFFER_SIZE = 8 << 20
+
 
 class CSVChunkManager:
     """
@@ -90,67 +98,38 @@ class CSVChunkManager:
 
         chunk_files = []
         chunk_num = 0
-        current_chunk_rows = []
         total_rows = 0
-        header = None
 
         try:
-            with open(csv_path, 'r', encoding='utf-8', errors='replace') as f:
+            with open(csv_path, 'r', encoding='utf-8', errors='replace',
+                      buffering=CSV_READ_BUFFER_SIZE) as f:
+                # Let the kernel read ahead aggressively for the linear scan
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
                 csv_reader = csv.reader(f, quoting=csv.QUOTE_MINIMAL)
 
                 # Read and save header
                 header = next(csv_reader)
 
-                for row in csv_reader:
-                    total_rows += 1
-                    current_chunk_rows.append(row)
-
-                    # Write chunk when it reaches chunk_size
-                    if len(current_chunk_rows) >= chunk_size:
-                        chunk_num += 1
-                        chunk_file = self._write_chunk(
-                            chunk_subdir=chunk_subdir,
-                            table_name=table_name,
-                            dataset_date=dataset_date,
-                            chunk_num=chunk_num,
-                            header=header,
-                            rows=current_chunk_rows,
-                            start_row=total_rows - len(current_chunk_rows) + 1,
-                            end_row=total_rows
-                        )
-                        chunk_files.append(chunk_file)
-
-                        # Track in database if session provided
-                        if db_session:
-                            self._create_chunk_progress_record(
-                                session=db_session,
-                                table_name=table_name,
-                                dataset_date=dataset_date,
-                                chunk_number=chunk_num,
-                                chunk_filename=chunk_file.name,
-                                start_row=total_rows - len(current_chunk_rows) + 1,
-                                end_row=total_rows,
-                                row_count=len(current_chunk_rows)
-                            )
-
-                        logger.info(f"Created chunk {chunk_num}: {chunk_file.name} ({len(current_chunk_rows):,} rows)")
-                        current_chunk_rows = []
-
-                # Write remaining rows as final chunk
-                if current_chunk_rows:
+                # Rows are streamed from the reader straight into each chunk
+                # file, so at most one row is held in memory at a time
+                while (first_row := next(csv_reader, None)) is not None:
                     chunk_num += 1
-                    chunk_file = self._write_chunk(
+                    start_row = total_rows + 1
+
+                    chunk_file, row_count = self._write_chunk(
                         chunk_subdir=chunk_subdir,
                         table_name=table_name,
                         dataset_date=dataset_date,
                         chunk_num=chunk_num,
                         header=header,
-                        rows=current_chunk_rows,
-                        start_row=total_rows - len(current_chunk_rows) + 1,
-                        end_row=total_rows
+                        rows=chain((first_row,), islice(csv_reader, chunk_size - 1))
                     )
+                    total_rows += row_count
                     chunk_files.append(chunk_file)
 
+                    # Track in database if session provided
                     if db_session:
                         self._create_chunk_progress_record(
                             session=db_session,
@@ -158,12 +137,12 @@ class CSVChunkManager:
                             dataset_date=dataset_date,
                             chunk_number=chunk_num,
                             chunk_filename=chunk_file.name,
-                            start_row=total_rows - len(current_chunk_rows) + 1,
+                            start_row=start_row,
                             end_row=total_rows,
-                            row_count=len(current_chunk_rows)
+                            row_count=row_count
                         )
 
-                    logger.info(f"Created final chunk {chunk_num}: {chunk_file.name} ({len(current_chunk_rows):,} rows)")
+                    logger.info(f"Created chunk {chunk_num}: {chunk_file.name} ({row_count:,} rows)")
 
             if db_session:
                 db_session.commit()
@@ -190,20 +169,21 @@ class CSVChunkManager:
         dataset_date: str,
         chunk_num: int,
         header: List[str],
-        rows: List[List[str]],
-        start_row: int,
-        end_row: int
-    ) -> Path:
-        """Write a chunk to a CSV file."""
+        rows: Iterable[List[str]]
+    ) -> Tuple[Path, int]:
+        """Write a chunk to a CSV file, returning its path and row count."""
         chunk_filename = f"{table_name}-{dataset_date}.chunk_{chunk_num:04d}.csv"
         chunk_path = chunk_subdir / chunk_filename
 
+        # zip draws a row before each count, so the counter stops at the
+        # number of rows written without a Python-level loop
+        counter = count()
         with open(chunk_path, 'w', encoding='utf-8', newline='') as f:
             csv_writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
             csv_writer.writerow(header)
-            csv_writer.writerows(rows)
+            csv_writer.writerows(map(itemgetter(0), zip(rows, counter)))
 
-        return chunk_path
+        return chunk_path, next(counter)
 
     def _create_chunk_progress_record(
         self,
@@ -270,8 +250,8 @@ class CSVChunkManager:
                     "rows_skipped": c.rows_skipped,
                     "duration_seconds": c.duration_seconds,
                     "error_message": c.error_message,
-                    "started_at": c.started_at.isoformat() if c.started_at else None,
-                    "completed_at": c.completed_at.isoformat() if c.completed_at else None,
+                    "started_at": c.started_at,
+                    "completed_at": c.completed_at,
                 }
                 for c in chunks
             ]
@@ -533,6 +513,9 @@ class CSVChunkManager:
             logger.info(f"Total rows imported: {results['total_rows_imported']:,}")
             logger.info(f"=" * 80)
 
+            if results["successful_chunks"]:
+                finish_import()
+
             return results
 
         finally:
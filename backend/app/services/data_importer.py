@@ -7,6 +7,8 @@ Handles foreign key dependencies and import ordering.
 Uses pandas instead of PostgreSQL COPY command to handle malformed CSV files
 with unquoted carriage returns and other format issues.
 """
+import csv
+import io
 import os
 import logging
 from pathlib import Path
@@ -112,7 +114,6 @@ class DataImporter:
             chunk_num = 0
 
             # Increase CSV field size limit first
-            import csv
             import sys
             maxInt = sys.maxsize
             while True:
@@ -138,18 +139,34 @@ class DataImporter:
 
             logger.info(f"Processing CSV in {chunk_size:,} row chunks with pandas (robust mode)")
 
+            # Every chunk has the file's header, so the column list and INSERT
+            # statement are built once from the first chunk
+            available_cols = None
+            insert_stmt = None
+
             for chunk_df in pd.read_csv(csv_path, **csv_params):
                 chunk_num += 1
 
-                # Filter to only columns that exist in database
-                available_cols = [col for col in chunk_df.columns if col in db_columns]
+                if insert_stmt is None:
+                    # Filter to only columns that exist in database
+                    available_cols = [col for col in chunk_df.columns if col in db_columns]
+
+                    # Skip self-referential foreign key columns if requested
+                    if skip_self_referential_fk:
+                        if table_name == "people_db_person":
+                            available_cols = [col for col in available_cols if col != "is_alias_of_id"]
+                        elif table_name == "people_db_court":
+                            available_cols = [col for col in available_cols if col != "parent_court_id"]
 
-                # Skip self-referential foreign key columns if requested
-                if skip_self_referential_fk:
-                    if table_name == "people_db_person":
-                        available_cols = [col for col in available_cols if col != "is_alias_of_id"]
-                    elif table_name == "people_db_court":
-                        available_cols = [col for col in available_cols if col != "parent_court_id"]
+                    # Batch insert with ON CONFLICT DO NOTHING
+                    columns = ', '.join([f'"{k}"' for k in available_cols])
+                    placeholders = ', '.join([f':{k}' for k in available_cols])
+
+                    insert_stmt = text(f"""
+                        INSERT INTO {table_name} ({columns})
+                        VALUES ({placeholders})
+                        ON CONFLICT (id) DO NOTHING
+                    """)
 
                 chunk_df = chunk_df[available_cols]
 
@@ -160,16 +177,6 @@ class DataImporter:
                 # Convert to list of dicts
                 chunk_rows = chunk_df.to_dict('records')
 
-                # Batch insert with ON CONFLICT DO NOTHING
-                columns = ', '.join([f'"{k}"' for k in available_cols])
-                placeholders = ', '.join([f':{k}' for k in available_cols])
-
-                insert_stmt = text(f"""
-                    INSERT INTO {table_name} ({columns})
-                    VALUES ({placeholders})
-                    ON CONFLICT (id) DO NOTHING
-                """)
-
                 try:
                     session.execute(insert_stmt, chunk_rows)
                     total_imported += len(chunk_rows)
@@ -233,9 +240,9 @@ class DataImporter:
 
             logger.info(f"Importing {csv_path} into {table_name}")
 
-            # Use pandas to read CSV (handles malformed CSV better) then insert via SQLAlchemy
-            # This avoids COPY format issues with unquoted carriage returns
-            import pandas as pd
+            # Parse with the csv module (handles malformed CSV better), then load the
+            # cleaned rows with COPY. Loading the raw file with COPY fails on
+            # unquoted carriage returns.
 
             # Get row count before import
             count_before = session.execute(text(f"SELECT COUNT(*) FROM {table_name}")).scalar()
@@ -266,7 +273,6 @@ class DataImporter:
             # Use Python's native csv module which handles multi-line quoted fields correctly
             # CourtListener CSVs have HTML/XML in quoted fields with embedded newlines
             # pandas csv parser fails on these, but Python's csv module handles them properly
-            import csv
             import sys
 
             # Increase CSV field size limit to handle very large HTML/XML fields
@@ -300,6 +306,10 @@ class DataImporter:
 
                 logger.info(f"Importing {len(available_columns)} columns: {', '.join(available_columns[:10])}{'...' if len(available_columns) > 10 else ''}")
 
+                # Parsed chunks are streamed into this staging table with COPY and
+                # moved into the target with ON CONFLICT (id) DO NOTHING (see _copy_rows)
+                staging_table = f"{table_name}_import_staging"
+
                 # Create column index mapping for available columns
                 col_indices = {col: header.index(col) for col in available_columns}
 
@@ -365,18 +375,8 @@ class DataImporter:
                     if len(chunk_rows) >= chunk_size:
                         chunk_num += 1
 
-                        # Batch insert using ON CONFLICT DO NOTHING
-                        columns = ', '.join([f'"{k}"' for k in available_columns])
-                        placeholders = ', '.join([f':{k}' for k in available_columns])
-
-                        insert_stmt = text(f"""
-                            INSERT INTO {table_name} ({columns})
-                            VALUES ({placeholders})
-                            ON CONFLICT (id) DO NOTHING
-                        """)
-
                         try:
-                            session.execute(insert_stmt, chunk_rows)
+                            self._copy_rows(session, table_name, staging_table, available_columns, chunk_rows)
                             total_rows_imported += len(chunk_rows)
                         except Exception as e:
                             # Rollback failed transaction to allow subsequent chunks to proceed
@@ -414,17 +414,8 @@ class DataImporter:
                 # Process remaining rows
                 if chunk_rows:
                     chunk_num += 1
-                    columns = ', '.join([f'"{k}"' for k in available_columns])
-                    placeholders = ', '.join([f':{k}' for k in available_columns])
-
-                    insert_stmt = text(f"""
-                        INSERT INTO {table_name} ({columns})
-                        VALUES ({placeholders})
-                        ON CONFLICT (id) DO NOTHING
-                    """)
-
                     try:
-                        session.execute(insert_stmt, chunk_rows)
+                        self._copy_rows(session, table_name, staging_table, available_columns, chunk_rows)
                         total_rows_imported += len(chunk_rows)
                     except Exception as e:
                         # Rollback failed transaction to allow final commit
@@ -460,6 +451,49 @@ class DataImporter:
             if should_close:
                 session.close()
     
+    def _copy_rows(
+        self,
+        session: Session,
+        table_name: str,
+        staging_table: str,
+        columns: List[str],
+        rows: List[Dict],
+    ) -> None:
+        """
+        Write parsed rows into table_name via COPY, skipping ids that already exist.
+
+        Rows are re-serialized as clean CSV (None becomes an unquoted empty field,
+        i.e. NULL), copied into staging_table, then moved across in one
+        INSERT ... SELECT. Runs inside the session's current transaction.
+
+        The session may hand back a different pooled connection after any
+        commit or rollback, so the staging table is created on the same cursor
+        as the COPY and dropped when the transaction ends.
+        """
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, fieldnames=columns).writerows(rows)
+        buffer.seek(0)
+
+        column_list = ', '.join(f'"{c}"' for c in columns)
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging_table} "
+                f"(LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.copy_expert(
+                f"COPY {staging_table} ({column_list}) FROM STDIN WITH (FORMAT CSV)",
+                buffer
+            )
+            cursor.execute(f"""
+                INSERT INTO {table_name} ({column_list})
+                SELECT {column_list} FROM {staging_table}
+                ON CONFLICT (id) DO NOTHING
+            """)
+            cursor.execute(f"TRUNCATE {staging_table}")
+        finally:
+            cursor.close()
+
     def import_csv_with_postgres_copy(
         self,
         table_name: str,
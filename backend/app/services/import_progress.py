@@ -0,0 +1,71 @@
+"""
+Import Progress Service
+
+Keeps the mv_import_progress materialized view fresh so monitoring endpoints
+can read table row counts without scanning the tables on every request.
+
+Counts for the large case law tables in the view are pg_class.reltuples
+estimates (accurate to within a few percent after ANALYZE); the small people
+tables are counted exactly.
+"""
+import asyncio
+import logging
+from typing import Dict
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.database import monitoring_engine
+
+logger = logging.getLogger(__name__)
+
+# How often the background task refreshes the view
+REFRESH_INTERVAL_SECONDS = 30
+
+SELECT_PROGRESS = text("SELECT table_name, current_count FROM mv_import_progress")
+REFRESH_PROGRESS = text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_import_progress")
+
+# Every API worker runs the refresh loop; this transaction-scoped advisory
+# lock lets one of them refresh per tick while the rest skip it
+REFRESH_LOCK_KEY = 0x6D765F6970  # "mv_ip"
+TRY_REFRESH_LOCK = text("SELECT pg_try_advisory_xact_lock(:key)")
+
+
+def get_import_progress_counts(db: Session) -> Dict[str, int]:
+    """
+    Read the latest row counts from mv_import_progress.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dictionary mapping table name to row count at the last refresh
+    """
+    result = db.execute(SELECT_PROGRESS)
+    return {row.table_name: row.current_count for row in result}
+
+
+def refresh_import_progress() -> None:
+    """
+    Refresh mv_import_progress without blocking readers.
+
+    Skipped if another process already holds the refresh lock.
+    """
+    with monitoring_engine.begin() as conn:
+        if conn.execute(TRY_REFRESH_LOCK, {"key": REFRESH_LOCK_KEY}).scalar():
+            conn.execute(REFRESH_PROGRESS)
+
+
+async def refresh_import_progress_loop(interval: int = REFRESH_INTERVAL_SECONDS) -> None:
+    """
+    Refresh mv_import_progress every interval seconds until cancelled.
+
+    Failures are logged and retried on the next tick.
+    """
+    while True:
+        try:
+            await run_in_threadpool(refresh_import_progress)
+        except Exception as e:
+            logger.warning(f"Failed to refresh mv_import_progress: {e}")
+        await asyncio.sleep(interval)
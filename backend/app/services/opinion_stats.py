@@ -0,0 +1,29 @@
+"""
+Opinion Stats Service
+
+Keeps the mv_opinion_status and mv_opinion_timeline materialized views fresh.
+
+Both views aggregate the whole search_opinioncluster table, which only changes
+when an import runs, so they are refreshed by the post-import hook
+(app.services.post_import) instead of being recomputed by the stats endpoints
+on every request.
+"""
+import logging
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+REFRESH_STATEMENTS = (
+    text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_opinion_status"),
+    text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_opinion_timeline"),
+)
+
+
+def refresh_opinion_stats() -> None:
+    """Refresh the opinion stats views without blocking readers."""
+    with engine.begin() as conn:
+        for stmt in REFRESH_STATEMENTS:
+            conn.execute(stmt)
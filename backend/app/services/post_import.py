@@ -0,0 +1,31 @@
+"""
+Post-Import Service
+
+Single hook for refreshing state derived from the imported tables. Every
+import path (Celery task, data management endpoints, chunked imports and
+detached import scripts) calls finish_import() once it is done, so nothing
+that depends on the data is left stale by whichever path was used.
+"""
+import logging
+
+from app.core.cache import DOCKETS_NAMESPACE, OPINIONS_NAMESPACE, invalidate_namespace
+from app.services.opinion_stats import refresh_opinion_stats
+
+logger = logging.getLogger(__name__)
+
+
+def finish_import() -> None:
+    """
+    Refresh derived state after an import completes.
+
+    Failures are logged rather than raised: the import itself has already
+    succeeded, and the next import refreshes everything again.
+    """
+    try:
+        refresh_opinion_stats()
+    except Exception as e:
+        logger.warning(f"Failed to refresh opinion stats views: {str(e)}")
+
+    # Cached browse and stats responses are stale once new rows land
+    invalidate_namespace(DOCKETS_NAMESPACE)
+    invalidate_namespace(OPINIONS_NAMESPACE)
@@ -0,0 +1,92 @@
+"""
+Row Count Service
+
+Cheap totals for paginated list endpoints.
+
+An exact COUNT(*) over a multi-million row table costs far more than fetching
+one page, so totals come from planner statistics: pg_class.reltuples for an
+unfiltered table and the EXPLAIN row estimate for a filtered query. An exact
+COUNT(*) only runs when the estimate says it will be cheap.
+"""
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Query, Session
+
+# Below this many (estimated) rows an exact COUNT(*) is cheap enough to run
+EXACT_COUNT_THRESHOLD = 10_000
+
+TABLE_ROW_ESTIMATE = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+TABLE_ROW_ESTIMATES = text(
+    "SELECT relname, reltuples::bigint FROM pg_class "
+    "WHERE oid = ANY(CAST(:tables AS regclass[]))"
+)
+
+
+def table_row_estimate(db: Session, table_name: str) -> Optional[int]:
+    """
+    Read the planner's row estimate for a whole table.
+
+    Returns:
+        Estimated row count, or None if the table has never been analyzed
+    """
+    estimate = db.execute(TABLE_ROW_ESTIMATE, {"table": table_name}).scalar()
+    return estimate if estimate is not None and estimate >= 0 else None
+
+
+def table_row_estimates(db: Session, table_names: Iterable[str]) -> Dict[str, int]:
+    """
+    Get row counts for several whole tables in one catalog query.
+
+    Tables estimated below EXACT_COUNT_THRESHOLD (or never analyzed) are
+    counted exactly instead.
+
+    Args:
+        db: Database session
+        table_names: Unqualified table names
+
+    Returns:
+        Dictionary mapping table name to row count
+    """
+    table_names = list(table_names)
+    counts = dict(db.execute(TABLE_ROW_ESTIMATES, {"tables": table_names}).all())
+    for table_name in table_names:
+        estimate = counts.get(table_name)
+        if estimate is None or estimate < EXACT_COUNT_THRESHOLD:
+            counts[table_name] = db.execute(text(f"SELECT COUNT(*) FROM {table_name}")).scalar()
+    return counts
+
+
+def query_row_estimate(db: Session, query: Query) -> int:
+    """
+    Read the planner's row estimate for a query via EXPLAIN (FORMAT JSON).
+
+    Args:
+        db: Database session
+        query: Unordered, unpaginated ORM query
+    """
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    plan = db.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def estimate_rows(
+    db: Session,
+    query: Query,
+    unfiltered_table: Optional[str] = None,
+) -> int:
+    """
+    Estimate how many rows a list query matches.
+
+    Args:
+        db: Database session
+        query: Filtered ORM query, before ordering and pagination
+        unfiltered_table: Table name when the query has no filters, so the
+            pg_class estimate can be used instead of EXPLAIN
+    """
+    estimate = table_row_estimate(db, unfiltered_table) if unfiltered_table else None
+    if estimate is None:
+        estimate = query_row_estimate(db, query)
+    return estimate
@@ -7,10 +7,12 @@ No authentication required - bucket is publicly accessible.
 import os
 import re
 import bz2
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datetime import datetime
 from pathlib import Path
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore import UNSIGNED
 from botocore.client import Config
 from botocore.exceptions import ClientError
@@ -19,6 +21,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Bulk files are several GB; fetch them as concurrent 64MB range GETs rather
+# than over a single connection
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+
 
 class CourtListenerDownloader:
     """
@@ -75,9 +86,14 @@ class CourtListenerDownloader:
     
     def __init__(self):
         """Initialize S3 client with unsigned config for public bucket."""
+        # Pool sized for TRANSFER_CONFIG's concurrent range GETs
         self.s3 = boto3.client(
             's3',
-            config=Config(signature_version=UNSIGNED)
+            config=Config(
+                signature_version=UNSIGNED,
+                max_pool_connections=50,
+                retries={"max_attempts": 10, "mode": "adaptive"},
+            )
         )
         self.data_dir = Path(settings.DATA_DIR)
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -298,7 +314,8 @@ class CourtListenerDownloader:
                 self.s3.download_file(
                     self.BUCKET_NAME,
                     key,
-                    str(temp_path)
+                    str(temp_path),
+                    Config=TRANSFER_CONFIG
                 )
                 # Decompress in chunks to avoid memory issues with large files
                 with bz2.open(temp_path, 'rb') as f_in:
@@ -318,7 +335,8 @@ class CourtListenerDownloader:
                 self.s3.download_file(
                     self.BUCKET_NAME,
                     key,
-                    str(target_path)
+                    str(target_path),
+                    Config=TRANSFER_CONFIG
                 )
                 logger.info(f"Downloaded {key} to {target_path}")
             
@@ -443,3 +461,14 @@ class CourtListenerDownloader:
         except ClientError as e:
             raise Exception(f"Error getting file size for {key}: {str(e)}")
 
+
+@lru_cache(maxsize=1)
+def get_downloader() -> CourtListenerDownloader:
+    """
+    Return the process-wide downloader, creating it on first use.
+
+    Defers boto3 client setup until a download route or task actually runs
+    instead of doing it at import time. boto3 clients are thread-safe, so one
+    instance is shared.
+    """
+    return CourtListenerDownloader()
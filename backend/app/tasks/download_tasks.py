@@ -5,14 +5,12 @@ Celery tasks for downloading files from S3 in the background.
 """
 from celery import Task
 from app.celery_app import celery_app
-from app.services.s3_downloader import CourtListenerDownloader
+from app.services.s3_downloader import get_downloader
 from typing import List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
-downloader = CourtListenerDownloader()
-
 
 @celery_app.task(bind=True, name="download_dataset")
 def download_dataset_task(
@@ -40,7 +38,7 @@ def download_dataset_task(
         )
         
         # Download files
-        downloaded = downloader.download_dataset(date=date, tables=tables)
+        downloaded = get_downloader().download_dataset(date=date, tables=tables)
         
         # Build result
         result = {
@@ -62,7 +60,9 @@ def download_dataset_task(
         raise
 
 
-@celery_app.task(bind=True, name="download_file")
+# Single bulk files take far longer than the 30 minute default to fetch and
+# decompress
+@celery_app.task(bind=True, name="download_file", soft_time_limit=3 * 60 * 60, time_limit=3 * 60 * 60 + 300)
 def download_file_task(
     self: Task,
     s3_key: str,
@@ -92,7 +92,7 @@ def download_file_task(
             from app.core.config import settings
             target_path = Path(settings.DATA_DIR) / target_filename
         
-        downloaded_path = downloader.download_file(s3_key, target_path)
+        downloaded_path = get_downloader().download_file(s3_key, target_path)
         
         result = {
             'status': 'completed',
@@ -8,6 +8,7 @@ from app.celery_app import celery_app
 from app.services.data_importer import DataImporter
 from app.services.data_validator import DataValidator
 from app.core.database import SessionLocal
+from app.services.post_import import finish_import
 from typing import List, Optional
 import logging
 
@@ -94,6 +95,9 @@ def import_dataset_task(
             'tables_completed': completed
         }
         
+        # Re-aggregate opinion stats and drop cached responses
+        finish_import()
+
         logger.info(f"Import completed for date {date}")
         return result
         
@@ -77,7 +77,7 @@ export default function Dockets() {
         <CardHeader>
           <CardTitle>Search Dockets</CardTitle>
           <CardDescription>
-            Search by case name, docket number, or keywords. {data && `${data.total.toLocaleString()} total cases in database.`}
+            Search by case name, docket number, or keywords. {data?.total != null && `${data.total.toLocaleString()} total cases in database.`}
           </CardDescription>
         </CardHeader>
         <CardContent>
@@ -116,7 +116,8 @@ export default function Dockets() {
           <CardDescription>
             {isLoading ? 'Loading...' : data ? (
               <>
-                Showing {((data.page - 1) * data.page_size) + 1} - {Math.min(data.page * data.page_size, data.total)} of {data.total.toLocaleString()} dockets
+                Showing {((data.page - 1) * data.page_size) + 1} - {((data.page - 1) * data.page_size) + data.items.length}
+                {data.total != null && ` of ${data.total.toLocaleString()}`} dockets
                 {searchParams.q && ` matching "${searchParams.q}"`}
               </>
             ) : null}
@@ -197,7 +198,7 @@ export default function Dockets() {
               {/* Pagination */}
               <div className="flex items-center justify-between mt-4">
                 <div className="text-sm text-gray-600">
-                  Page {data.page} of {data.total_pages.toLocaleString()}
+                  Page {data.page}{data.total_pages != null && ` of ${data.total_pages.toLocaleString()}`}
                 </div>
                 <div className="flex gap-2">
                   <Button
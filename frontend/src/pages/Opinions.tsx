@@ -92,7 +92,7 @@ export default function Opinions() {
         <CardHeader>
           <CardTitle>Search Opinions</CardTitle>
           <CardDescription>
-            Search by case name, judge names, or keywords. {data && `${data.total.toLocaleString()} total opinions in database.`}
+            Search by case name, judge names, or keywords. {data && `${data.total_is_estimate ? '~' : ''}${data.total.toLocaleString()} total opinions in database.`}
           </CardDescription>
         </CardHeader>
         <CardContent>
@@ -144,7 +144,7 @@ export default function Opinions() {
           <CardDescription>
             {isLoading ? 'Loading...' : data ? (
               <>
-                Showing {((data.page - 1) * data.page_size) + 1} - {Math.min(data.page * data.page_size, data.total)} of {data.total.toLocaleString()} opinions
+                Showing {((data.page - 1) * data.page_size) + 1} - {Math.min(data.page * data.page_size, data.total)} of {data.total_is_estimate ? '~' : ''}{data.total.toLocaleString()} opinions
                 {searchParams.q && ` matching "${searchParams.q}"`}
               </>
             ) : null}
@@ -33,14 +33,15 @@ export interface DocketSearchParams {
   page_size?: number
   sort_by?: string
   sort_order?: 'asc' | 'desc'
+  include_total?: boolean
 }
 
 export interface DocketSearchResponse {
   items: DocketListItem[]
-  total: number
+  total: number | null
   page: number
   page_size: number
-  total_pages: number
+  total_pages: number | null
   has_next: boolean
   has_prev: boolean
 }
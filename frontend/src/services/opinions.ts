@@ -40,6 +40,7 @@ export interface OpinionSearchParams {
 export interface OpinionSearchResponse {
   items: OpinionListItem[]
   total: number
+  total_is_estimate: boolean
   page: number
   page_size: number
   total_pages: number